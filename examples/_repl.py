@@ -0,0 +1,52 @@
+"""
+Type-ahead input for the interactive examples.
+
+A daemon thread reads lines into a queue, so the next instruction can be
+typed while the agent is still working on the current one. The main thread
+takes lines off the queue and runs the turns in order. All output,
+including the "You:" prompt, is printed by the main thread between turns.
+The reader never writes to stdout, so it can't interleave with the
+agent's streamed reply.
+
+Usage:
+    from _repl import InputQueue
+
+    inputs = InputQueue()
+    while (line := inputs.get()) is not None:
+        agent(line)
+"""
+
+import queue
+import threading
+
+
+class InputQueue:
+    """Queue of typed lines fed by a background reader thread."""
+
+    def __init__(self, prompt: str = "\nYou: "):
+        self.prompt = prompt
+        self._lines: queue.Queue = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self) -> None:
+        """Queue typed lines until exit/quit or end of input (queued as None)."""
+        while True:
+            try:
+                line = input().strip()
+            except (EOFError, KeyboardInterrupt):
+                self._lines.put(None)
+                return
+            self._lines.put(line)
+            if line.lower() in ("exit", "quit"):
+                return
+
+    def get(self) -> str | None:
+        """
+        Next line, or None once input has ended.
+
+        Call between turns. The prompt is shown only when nothing was typed
+        ahead, so it always follows the previous reply.
+        """
+        if self._lines.empty():
+            print(self.prompt, end="", flush=True)
+        return self._lines.get()
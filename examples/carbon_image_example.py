@@ -11,118 +11,37 @@ Prerequisites:
 Includes hub integration for session tracking and metrics.
 """
 
+import os
 import sys
+import atexit
 import argparse
+import json
 import time
 from pathlib import Path
 
-# Add repo root to path for imports
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
+# Add repo root to path for imports (set STRANDS_REPO_ROOT if examples/ is symlinked)
+REPO_ROOT = os.getenv("STRANDS_REPO_ROOT") or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
 
 from dotenv import load_dotenv
 load_dotenv()
 
-from strands import Agent
-from src.tools.carbon_image import (
-    generate_code_image,
-    generate_code_image_from_file,
-    list_carbon_themes,
-)
-from src.models import anthropic_model
-from src.config import CARBON_IMAGE_PROMPT
-from src.hub import (
-    create_session_manager,
-    MetricsExporter,
-    AgentRegistry,
-)
-from src.hub.session import generate_run_id
-
 # Agent configuration
 AGENT_ID = "carbon-code-imager"
 AGENT_NAME = "Carbon Code Image Generator"
 
-# Sample code snippets for demonstration
-SAMPLE_CODE = {
-    "python": '''def fibonacci(n: int) -> list[int]:
-    """Generate Fibonacci sequence."""
-    if n <= 0:
-        return []
-    elif n == 1:
-        return [0]
-
-    fib = [0, 1]
-    for _ in range(2, n):
-        fib.append(fib[-1] + fib[-2])
-    return fib
-
-print(fibonacci(10))''',
-
-    "javascript": '''const debounce = (fn, delay) => {
-  let timeoutId;
-  return (...args) => {
-    clearTimeout(timeoutId);
-    timeoutId = setTimeout(() => fn(...args), delay);
-  };
-};
-
-// Usage
-const handleSearch = debounce((query) => {
-  console.log(`Searching: ${query}`);
-}, 300);''',
-
-    "rust": '''use std::collections::HashMap;
-
-fn word_count(text: &str) -> HashMap<String, usize> {
-    let mut counts = HashMap::new();
-
-    for word in text.split_whitespace() {
-        let word = word.to_lowercase();
-        *counts.entry(word).or_insert(0) += 1;
-    }
-
-    counts
-}
-
-fn main() {
-    let text = "hello world hello rust";
-    println!("{:?}", word_count(text));
-}''',
-
-    "go": '''package main
-
-import (
-    "fmt"
-    "sync"
-)
-
-func worker(id int, jobs <-chan int, results chan<- int, wg *sync.WaitGroup) {
-    defer wg.Done()
-    for job := range jobs {
-        fmt.Printf("Worker %d processing job %d\\n", id, job)
-        results <- job * 2
-    }
-}
-
-func main() {
-    jobs := make(chan int, 100)
-    results := make(chan int, 100)
-    var wg sync.WaitGroup
-
-    for w := 1; w <= 3; w++ {
-        wg.Add(1)
-        go worker(w, jobs, results, &wg)
-    }
-
-    for j := 1; j <= 5; j++ {
-        jobs <- j
-    }
-    close(jobs)
-
-    wg.Wait()
-    close(results)
-}''',
-}
+# Sample code snippets for demonstration (examples/assets/sample_code.json, loaded on first use)
+SAMPLE_NAMES = ("python", "javascript", "rust", "go")
+_SAMPLES: dict[str, str] | None = None
+
+
+def _load_samples() -> dict[str, str]:
+    """Load the sample snippets; only the generation paths need them."""
+    global _SAMPLES
+    if _SAMPLES is None:
+        path = Path(__file__).parent / "assets" / "sample_code.json"
+        _SAMPLES = json.loads(path.read_text(encoding="utf-8"))
+    return _SAMPLES
 
 
 def main():
@@ -138,7 +57,7 @@ def main():
     parser.add_argument(
         "--sample",
         type=str,
-        choices=list(SAMPLE_CODE.keys()),
+        choices=SAMPLE_NAMES,
         default="python",
         help="Use a sample code snippet"
     )
@@ -181,9 +100,52 @@ def main():
         action="store_true",
         help="Disable hub tracking"
     )
+    parser.add_argument(
+        "--all-samples",
+        action="store_true",
+        help="Render every sample snippet concurrently"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum concurrent renders with --all-samples (default: 4)"
+    )
+    parser.add_argument(
+        "--fidelity",
+        choices=["fast", "carbon"],
+        default="fast",
+        help="fast: draw with Pygments when the theme allows (no browser); carbon: full Carbon look (default: fast)"
+    )
+    parser.add_argument(
+        "--online",
+        action="store_true",
+        help="Render with the hosted carbon.now.sh app instead of the local shell"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-render instead of reusing cached images"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=200,
+        help="Maximum cached images kept in the output directory (default: 200)"
+    )
 
     args = parser.parse_args()
 
+    # Imports are deferred until after argument parsing so --help stays fast
+    from src.tools.carbon_image import (
+        generate_code_image,
+        generate_code_image_from_file,
+        list_carbon_themes,
+        configure_render_cache,
+        generate_code_images,
+    )
+    from src.tools import _async_runtime
+
     # List themes and exit
     if args.list_themes:
         themes = list_carbon_themes()
@@ -197,9 +159,25 @@ def main():
         print(f"\nDefault: {themes['default']}")
         return
 
+    # Strands, model SDKs and the hub are only needed past this point
+    from strands import Agent
+    from src.models import anthropic_model
+    from src.config import CARBON_IMAGE_PROMPT
+    from src.hub import (
+        create_session_manager,
+        MetricsExporter,
+        AgentRegistry,
+    )
+    from src.hub.session import generate_run_id
+
     # Ensure output directory exists
     Path(args.output_dir).mkdir(parents=True, exist_ok=True)
 
+    configure_render_cache(enabled=not args.no_cache, max_entries=args.cache_size)
+
+    # Tear down the shared Chromium pool and runtime loop on exit (including Ctrl+C in interactive mode)
+    atexit.register(_async_runtime.shutdown)
+
     # Initialize hub components (unless disabled)
     run_id = None
     registry = None
@@ -238,19 +216,27 @@ def main():
         if not args.no_hub:
             session_manager = create_session_manager(agent_id=AGENT_ID, run_id=run_id)
 
+        system_prompt = CARBON_IMAGE_PROMPT.format(output_dir=args.output_dir)
+
         model = anthropic_model()
         agent = Agent(
             model=model,
             tools=[generate_code_image, generate_code_image_from_file, list_carbon_themes],
             session_manager=session_manager,
-            system_prompt=CARBON_IMAGE_PROMPT.format(output_dir=args.output_dir),
+            system_prompt=system_prompt,
         )
 
+        # Input is read on a background thread, so the next instruction can be
+        # typed while the current one renders; this thread runs the turns in order.
+        from _repl import InputQueue
+
+        inputs = InputQueue()
+
         generation_count = 0
         while True:
             try:
-                user_input = input("\nYou: ").strip()
-                if user_input.lower() in ["exit", "quit"]:
+                user_input = inputs.get()
+                if user_input is None or user_input.lower() in ["exit", "quit"]:
                     print("Goodbye!")
                     success = True
                     break
@@ -269,9 +255,40 @@ def main():
         if metrics:
             metrics.set_stats("generation_count", generation_count)
 
+    elif args.all_samples:
+        # Batch mode: one shared browser pool, renders run concurrently
+        samples = _load_samples()
+        print(f"Generating {len(samples)} sample images (concurrency {args.concurrency})...")
+
+        jobs = [
+            {
+                "code": sample,
+                "language": name,
+                "theme": args.theme,
+                "background_color": args.background,
+                "output_dir": args.output_dir,
+                "online": args.online,
+                "fidelity": args.fidelity,
+            }
+            for name, sample in samples.items()
+        ]
+        results = generate_code_images(jobs, concurrency=args.concurrency)
+
+        for name, result in zip(samples, results):
+            if result["success"]:
+                print(f"  {name}: {result['file_path']}")
+            else:
+                print(f"  {name}: Error: {result.get('error', 'Unknown error')}")
+
+        success = all(r["success"] for r in results)
+        if metrics:
+            metrics.set_stats("operation", "generate_all_samples")
+            metrics.set_stats("output_files", [r["file_path"] for r in results if r["success"]])
+            metrics.set_stats("theme", args.theme)
+
     else:
         # Direct generation mode
-        code = args.code if args.code else SAMPLE_CODE.get(args.sample, SAMPLE_CODE["python"])
+        code = args.code if args.code else _load_samples()[args.sample]
         language = args.language if args.language != "auto" else args.sample
 
         print(f"Generating code image...")
@@ -285,10 +302,14 @@ def main():
             theme=args.theme,
             background_color=args.background,
             output_dir=args.output_dir,
+            online=args.online,
+            fidelity=args.fidelity,
         )
 
         if result["success"]:
             print(f"Success! Image saved to: {result['file_path']}")
+            if result.get("cached"):
+                print("(reused cached render)")
             success = True
             if metrics:
                 metrics.set_stats("operation", "generate")
@@ -310,6 +331,8 @@ def main():
     if registry:
         registry.record_run(agent_id=AGENT_ID, run_id=run_id, success=success)
 
+    _async_runtime.shutdown()
+
 
 if __name__ == "__main__":
     main()
@@ -8,28 +8,19 @@ with Gemini 3 Pro Image Preview model.
 Includes hub integration for session tracking and metrics.
 """
 
+import os
 import sys
 import argparse
 import time
 from pathlib import Path
 
-# Add repo root to path for imports
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
+# Add repo root to path for imports (set STRANDS_REPO_ROOT if examples/ is symlinked)
+REPO_ROOT = os.getenv("STRANDS_REPO_ROOT") or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
 
 from dotenv import load_dotenv
 load_dotenv()
 
-from strands import Agent
-from src.tools.gemini_image import generate_image, edit_image
-from src.models import gemini_model
-from src.hub import (
-    create_session_manager,
-    MetricsExporter,
-    AgentRegistry,
-)
-from src.hub.session import generate_run_id
-
 # Agent configuration
 AGENT_ID = "gemini-image-generator"
 AGENT_NAME = "Gemini Image Generator"
@@ -74,6 +65,18 @@ def main():
 
     args = parser.parse_args()
 
+    # Imports are deferred until after argument parsing so --help stays fast
+    from strands import Agent
+    from src.tools.gemini_image import generate_image, edit_image
+    from src.tools._genai_client import preconnect
+    from src.models import gemini_model
+    from src.hub import (
+        create_session_manager,
+        MetricsExporter,
+        AgentRegistry,
+    )
+    from src.hub.session import generate_run_id
+
     # Ensure output directory exists
     Path(args.output_dir).mkdir(parents=True, exist_ok=True)
 
@@ -132,11 +135,20 @@ Always confirm the output file path after generation.
 Save images to the '{args.output_dir}' directory.""",
         )
 
+        # The image tools share one genai client; warm it while the user types
+        preconnect(os.getenv("GOOGLE_API_KEY"))
+
+        # Input is read on a background thread, so the next instruction can be
+        # typed while the current one renders; this thread runs the turns in order.
+        from _repl import InputQueue
+
+        inputs = InputQueue()
+
         generation_count = 0
         while True:
             try:
-                user_input = input("\nYou: ").strip()
-                if user_input.lower() in ["exit", "quit"]:
+                user_input = inputs.get()
+                if user_input is None or user_input.lower() in ["exit", "quit"]:
                     print("Goodbye!")
                     success = True
                     break
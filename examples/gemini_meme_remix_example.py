@@ -20,20 +20,14 @@ import argparse
 import time
 from pathlib import Path
 
-# Add repo root to path for imports
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
+# Add repo root to path for imports (set STRANDS_REPO_ROOT if examples/ is symlinked)
+REPO_ROOT = os.getenv("STRANDS_REPO_ROOT") or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from strands import Agent
-from src.hub import AgentRegistry, MetricsExporter, create_session_manager
-from src.hub.session import generate_run_id
-from src.models import gemini_model
-from src.tools import understand_image, generate_image
-
 
 AGENT_ID = "gemini-meme-remix"
 AGENT_NAME = "Gemini Meme Remix"
@@ -90,6 +84,14 @@ def main() -> None:
     if not meme_path.exists():
         raise SystemExit(f"Meme file not found: {args.meme}")
 
+    # Imports are deferred until the arguments are validated so --help and bad input fail fast
+    from strands import Agent
+    from src.hub import AgentRegistry, MetricsExporter, create_session_manager
+    from src.hub.session import generate_run_id
+    from src.models import gemini_model
+    from src.tools import generate_image
+    from src.tools.gemini_image_understanding import understand_image
+
     # Enable Gemini 3 tool-calling signatures if user runs the agent on Gemini 3
     _apply_gemini3_thought_signature_workaround()
 
@@ -152,30 +154,37 @@ You MUST follow this procedure:
     )
 
     # The agent needs the meme path as data. Provide it in the user message and in the tool call instructions.
-    def run_once(user_instruction: str) -> str:
-        return agent(
-            f"""Meme image path: "{str(meme_path)}"
+    # Built once so every turn sends an identical prefix.
+    user_prefix = f"""Meme image path: "{meme_path}"
 
-Use understand_image(image_path="{str(meme_path)}", model="{args.analysis_model}") first.
-Then generate_image(model="{args.image_model}", reference_images=["{str(meme_path)}"], output_dir="{args.output_dir}").
+Use understand_image(image_path="{meme_path}", model="{args.analysis_model}") first.
+Then generate_image(model="{args.image_model}", reference_images=["{meme_path}"], output_dir="{args.output_dir}").
 
 User instruction:
-{user_instruction}
 """
-        )
+
+    def run_once(user_instruction: str) -> str:
+        return agent(f"{user_prefix}{user_instruction}\n")
 
     if args.interactive:
         print(f"\n{AGENT_NAME}")
         print("Type a new idea/prompt for the next remix, or 'exit' to quit.\n")
+
+        # Input is read on a background thread, so the next remix can be typed while the current one renders
+        from _repl import InputQueue
+
+        inputs = InputQueue()
+
         while True:
             try:
-                user_input = input("\nYou: ").strip()
-                if user_input.lower() in ("exit", "quit"):
+                user_input = inputs.get()
+                if user_input is None or user_input.lower() in ("exit", "quit"):
                     success = True
                     break
                 if not user_input:
                     continue
-                print(run_once(user_input))
+                response = run_once(user_input)
+                print(response)
                 remix_count += 1
             except KeyboardInterrupt:
                 success = True
@@ -8,33 +8,58 @@ with Lyria RealTime model.
 Includes hub integration for session tracking and metrics.
 """
 
+import os
 import sys
 import argparse
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add repo root to path for imports
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
+# Add repo root to path for imports (set STRANDS_REPO_ROOT if examples/ is symlinked)
+REPO_ROOT = os.getenv("STRANDS_REPO_ROOT") or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
 
 from dotenv import load_dotenv
 load_dotenv()
 
-from strands import Agent
-from src.tools.gemini_music import generate_music, generate_music_weighted
-from src.models import gemini_model
-from src.hub import (
-    create_session_manager,
-    MetricsExporter,
-    AgentRegistry,
-)
-from src.hub.session import generate_run_id
 
 # Agent configuration
 AGENT_ID = "gemini-music-generator"
 AGENT_NAME = "Gemini Music Generator"
 
 
+# Static system prompt: kept byte-identical across runs so provider prompt caches hit.
+# Per-run details (output directory) are appended after it.
+SYSTEM_PROMPT_STATIC = """You are a music generation assistant using Lyria RealTime.
+
+You can:
+- Generate music from text descriptions using generate_music
+- Blend musical styles using generate_music_weighted with weighted prompts
+
+When generating music:
+- Describe genre, mood, tempo, and instruments
+- Use weighted prompts to blend styles (e.g., jazz 0.7 + electronic 0.3)
+- Duration can be 5-120 seconds
+- Output is stereo 48kHz WAV format
+
+Always confirm the output file path after generation."""
+
+
+# "text:weight" with a numeric weight; anything else is plain text at weight 1.0
+_WP_RE = re.compile(r"^(.*):\s*([-+]?\d*\.?\d+)\s*$")
+
+
+def _parse_weighted_prompts(entries: list[str]) -> list[dict]:
+    """Parse 'text:weight' entries into weighted prompt dicts (weight defaults to 1.0)."""
+    match = _WP_RE.match
+    return [
+        {"text": m.group(1).strip(), "weight": float(m.group(2))} if (m := match(p))
+        else {"text": p.strip(), "weight": 1.0}
+        for p in entries
+    ]
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate music with Lyria RealTime")
     parser.add_argument(
@@ -67,6 +92,18 @@ def main():
         default=None,
         help="Weighted prompts in format 'text:weight' (e.g., 'jazz:0.7' 'electronic:0.3')"
     )
+    parser.add_argument(
+        "--prompts-file",
+        type=str,
+        default=None,
+        help="Batch mode: one piece per line, weighted prompts separated by '|' (e.g. 'jazz:0.7 | electronic:0.3')"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum concurrent generations with --prompts-file (default: 4)"
+    )
     parser.add_argument(
         "--interactive",
         action="store_true",
@@ -80,8 +117,18 @@ def main():
 
     args = parser.parse_args()
 
-    # Ensure output directory exists
-    Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+    # Imports are deferred until after argument parsing so --help stays fast;
+    # Strands, the model SDKs and each tool are imported only on the path that uses them.
+    from src.hub import (
+        create_session_manager,
+        MetricsExporter,
+        AgentRegistry,
+    )
+    from src.hub.session import generate_run_id
+
+    # Ensure output directory exists (a single stat when it already does, as in batch sweeps)
+    if not os.path.isdir(args.output_dir):
+        os.makedirs(args.output_dir, exist_ok=True)
 
     # Initialize hub components (unless disabled)
     run_id = None
@@ -113,6 +160,14 @@ def main():
 
     if args.interactive:
         # Interactive agent mode
+        from strands import Agent
+        from src.models import gemini_model
+        from src.tools.gemini_music import generate_music, generate_music_weighted
+        try:
+            import readline  # noqa: F401 - line editing and history for input()
+        except ImportError:  # Windows
+            pass
+
         print(f"\n{AGENT_NAME}")
         print("Available tools: generate_music, generate_music_weighted")
         print("Note: Music generation is real-time streaming")
@@ -128,20 +183,7 @@ def main():
             model=model,
             tools=[generate_music, generate_music_weighted],
             session_manager=session_manager,
-            system_prompt=f"""You are a music generation assistant using Lyria RealTime.
-
-You can:
-- Generate music from text descriptions using generate_music
-- Blend musical styles using generate_music_weighted with weighted prompts
-
-When generating music:
-- Describe genre, mood, tempo, and instruments
-- Use weighted prompts to blend styles (e.g., jazz 0.7 + electronic 0.3)
-- Duration can be 5-120 seconds
-- Output is stereo 48kHz WAV format
-
-Always confirm the output file path after generation.
-Save music to the '{args.output_dir}' directory.""",
+            system_prompt=f"{SYSTEM_PROMPT_STATIC}\nSave music to the '{args.output_dir}' directory.",
         )
 
         generation_count = 0
@@ -167,15 +209,48 @@ Save music to the '{args.output_dir}' directory.""",
         if metrics:
             metrics.set_stats("generation_count", generation_count)
 
+    elif args.prompts_file:
+        # Batch mode: each line is one weighted piece, generated concurrently
+        from src.tools.gemini_music import generate_music_weighted
+
+        lines = Path(args.prompts_file).read_text(encoding="utf-8").splitlines()
+        groups = [_parse_weighted_prompts(line.split("|")) for line in lines if line.strip()]
+
+        print(f"Generating {len(groups)} pieces (concurrency {args.concurrency})...")
+        print(f"Duration: {args.duration}s each")
+
+        # Generation is network-bound streaming, so threads overlap the waits
+        with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+            results = list(executor.map(
+                lambda group: generate_music_weighted(
+                    prompts=group,
+                    output_dir=args.output_dir,
+                    duration_seconds=args.duration,
+                ),
+                groups,
+            ))
+
+        for group, result in zip(groups, results):
+            label = " + ".join(wp["text"] for wp in group)
+            if result["success"]:
+                print(f"  {label}: {result['file_path']}")
+            else:
+                print(f"  {label}: Error: {result.get('error', 'Unknown error')}")
+
+        success = all(r["success"] for r in results)
+        if metrics:
+            metrics.update({
+                "operation": "weighted_batch",
+                "output_files": [r["file_path"] for r in results if r["success"]],
+                "num_pieces": len(groups),
+                "duration_seconds": args.duration,
+            })
+
     elif args.weighted and args.prompts:
         # Weighted prompts mode
-        weighted_prompts = []
-        for p in args.prompts:
-            if ":" in p:
-                text, weight = p.rsplit(":", 1)
-                weighted_prompts.append({"text": text, "weight": float(weight)})
-            else:
-                weighted_prompts.append({"text": p, "weight": 1.0})
+        from src.tools.gemini_music import generate_music_weighted
+
+        weighted_prompts = _parse_weighted_prompts(args.prompts)
 
         print(f"Generating music with weighted prompts...")
         for wp in weighted_prompts:
@@ -192,10 +267,12 @@ Save music to the '{args.output_dir}' directory.""",
             print(f"Success! Music saved to: {result['file_path']}")
             success = True
             if metrics:
-                metrics.set_stats("operation", "weighted")
-                metrics.set_stats("output_file", result["file_path"])
-                metrics.set_stats("num_prompts", len(weighted_prompts))
-                metrics.set_stats("duration_seconds", result["duration"])
+                metrics.update({
+                    "operation": "weighted",
+                    "output_file": result["file_path"],
+                    "num_prompts": len(weighted_prompts),
+                    "duration_seconds": result["duration"],
+                })
         else:
             print(f"Error: {result.get('error', 'Unknown error')}")
             if metrics:
@@ -203,6 +280,8 @@ Save music to the '{args.output_dir}' directory.""",
 
     else:
         # Single prompt mode
+        from src.tools.gemini_music import generate_music
+
         print(f"Generating music...")
         print(f"Prompt: {args.prompt}")
         print(f"Duration: {args.duration}s")
@@ -217,24 +296,31 @@ Save music to the '{args.output_dir}' directory.""",
             print(f"Success! Music saved to: {result['file_path']}")
             success = True
             if metrics:
-                metrics.set_stats("operation", "single_prompt")
-                metrics.set_stats("output_file", result["file_path"])
-                metrics.set_stats("prompt", args.prompt)
-                metrics.set_stats("duration_seconds", result["duration"])
+                metrics.update({
+                    "operation": "single_prompt",
+                    "output_file": result["file_path"],
+                    "prompt": args.prompt,
+                    "duration_seconds": result["duration"],
+                })
         else:
             print(f"Error: {result.get('error', 'Unknown error')}")
             if metrics:
                 metrics.set_stats("error", result.get("error"))
 
-    # Export metrics and record run
-    if metrics:
-        elapsed = time.time() - start_time
-        metrics.set_timing("total_duration", elapsed)
-        metrics_path = metrics.export()
-        print(f"Metrics saved to: {metrics_path}")
+    # Export metrics and record run; the export (local file or S3 put)
+    # runs in the background while the registry is updated
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        export_future = None
+        if metrics:
+            elapsed = time.time() - start_time
+            metrics.set_timing("total_duration", elapsed)
+            export_future = executor.submit(metrics.export)
+
+        if registry:
+            registry.record_run(agent_id=AGENT_ID, run_id=run_id, success=success)
 
-    if registry:
-        registry.record_run(agent_id=AGENT_ID, run_id=run_id, success=success)
+        if export_future:
+            print(f"Metrics saved to: {export_future.result()}")
 
 
 if __name__ == "__main__":
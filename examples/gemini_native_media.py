@@ -15,16 +15,21 @@ Run:
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
 # Make repo root importable so `from src...` works when running from `examples/`
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
+# (set STRANDS_REPO_ROOT if examples/ is symlinked)
+REPO_ROOT = os.getenv("STRANDS_REPO_ROOT") or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
 
 from dotenv import load_dotenv
 
-from src.tools.gemini_media import generate_image, caption_image, generate_video
+
+def _normalize_out(path: str) -> Path:
+    """Resolve --out relative to examples/ unless it already starts there."""
+    return Path(path) if path.startswith("examples/") else Path("examples") / path
 
 
 def main() -> int:
@@ -36,7 +41,7 @@ def main() -> int:
     p_img = sub.add_parser("image", help="Generate an image")
     p_img.add_argument("--prompt", required=True)
     p_img.add_argument("--model", default="gemini-3-pro-image-preview")
-    p_img.add_argument("--out", default="output/generated_image.png")
+    p_img.add_argument("--out", default="output/generated_image.png", type=_normalize_out)
 
     p_cap = sub.add_parser("caption", help="Caption an existing image")
     p_cap.add_argument("--image", required=True)
@@ -46,29 +51,33 @@ def main() -> int:
     p_vid = sub.add_parser("video", help="Generate a video (Veo)")
     p_vid.add_argument("--prompt", required=True)
     p_vid.add_argument("--model", default="veo-3.1-generate-preview")
-    p_vid.add_argument("--out", default="output/generated_video.mp4")
+    p_vid.add_argument("--out", default="output/generated_video.mp4", type=_normalize_out)
     p_vid.add_argument("--poll-seconds", type=int, default=10)
     p_vid.add_argument("--timeout-seconds", type=int, default=600)
 
     args = parser.parse_args()
 
     if args.cmd == "image":
-        out_path = Path("examples") / args.out if not str(args.out).startswith("examples/") else Path(args.out)
-        p = generate_image(args.prompt, model=args.model, out_path=out_path)
+        from src.tools.gemini_media import generate_image
+
+        p = generate_image(args.prompt, model=args.model, out_path=args.out)
         print(f"Saved image -> {p}")
         return 0
 
     if args.cmd == "caption":
+        from src.tools.gemini_media import caption_image
+
         text = caption_image(Path(args.image), prompt=args.prompt, model=args.model)
         print(text)
         return 0
 
     if args.cmd == "video":
-        out_path = Path("examples") / args.out if not str(args.out).startswith("examples/") else Path(args.out)
+        from src.tools.gemini_media import generate_video
+
         p = generate_video(
             args.prompt,
             model=args.model,
-            out_path=out_path,
+            out_path=args.out,
             poll_seconds=args.poll_seconds,
             timeout_seconds=args.timeout_seconds,
         )
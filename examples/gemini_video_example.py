@@ -8,33 +8,43 @@ with Veo 3.1 model.
 Includes hub integration for session tracking and metrics.
 """
 
+import os
 import sys
 import argparse
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Add repo root to path for imports
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
+# Add repo root to path for imports (set STRANDS_REPO_ROOT if examples/ is symlinked)
+REPO_ROOT = os.getenv("STRANDS_REPO_ROOT") or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
 
 from dotenv import load_dotenv
 load_dotenv()
 
-from strands import Agent
-from src.tools.gemini_video import generate_video, generate_video_from_image
-from src.models import gemini_model
-from src.hub import (
-    create_session_manager,
-    MetricsExporter,
-    AgentRegistry,
-)
-from src.hub.session import generate_run_id
 
 # Agent configuration
 AGENT_ID = "gemini-video-generator"
 AGENT_NAME = "Gemini Video Generator"
 
 
+# Static system prompt: kept byte-identical across runs so provider prompt caches hit.
+# Per-run details (output directory) are appended after it.
+SYSTEM_PROMPT_STATIC = """You are a video generation assistant using Veo 3.1.
+
+You can:
+- Generate videos from text descriptions using generate_video
+- Animate images into videos using generate_video_from_image
+
+When generating videos:
+- Describe camera motion (pan, zoom, tracking shot, etc.)
+- Include lighting and atmosphere details
+- Mention style (cinematic, documentary, etc.)
+- Video generation takes 1-5 minutes, so set expectations
+- Duration can be 4 or 6 seconds
+
+Always confirm the output file path after generation."""
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate videos with Veo 3.1")
     parser.add_argument(
@@ -59,8 +69,15 @@ def main():
     parser.add_argument(
         "--image",
         type=str,
+        nargs="+",
         default=None,
-        help="Path to image for image-to-video generation"
+        help="Path(s) to image(s) for image-to-video generation; several images are generated concurrently"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum concurrent generations when several --image paths are given (default: 4)"
     )
     parser.add_argument(
         "--max-wait",
@@ -81,8 +98,18 @@ def main():
 
     args = parser.parse_args()
 
-    # Ensure output directory exists
-    Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+    # Imports are deferred until after argument parsing so --help stays fast;
+    # Strands, the model SDKs and each tool are imported only on the path that uses them.
+    from src.hub import (
+        create_session_manager,
+        MetricsExporter,
+        AgentRegistry,
+    )
+    from src.hub.session import generate_run_id
+
+    # Ensure output directory exists (a single stat when it already does, as in batch sweeps)
+    if not os.path.isdir(args.output_dir):
+        os.makedirs(args.output_dir, exist_ok=True)
 
     # Initialize hub components (unless disabled)
     run_id = None
@@ -114,6 +141,15 @@ def main():
 
     if args.interactive:
         # Interactive agent mode
+        from strands import Agent
+        from src.models import gemini_model
+        from src.tools.gemini_video import generate_video, generate_video_from_image
+        from src.tools._genai_client import preconnect
+        try:
+            import readline  # noqa: F401 - line editing and history for input()
+        except ImportError:  # Windows
+            pass
+
         print(f"\n{AGENT_NAME}")
         print("Available tools: generate_video, generate_video_from_image")
         print("Note: Video generation takes 1-5 minutes")
@@ -129,23 +165,12 @@ def main():
             model=model,
             tools=[generate_video, generate_video_from_image],
             session_manager=session_manager,
-            system_prompt=f"""You are a video generation assistant using Veo 3.1.
-
-You can:
-- Generate videos from text descriptions using generate_video
-- Animate images into videos using generate_video_from_image
-
-When generating videos:
-- Describe camera motion (pan, zoom, tracking shot, etc.)
-- Include lighting and atmosphere details
-- Mention style (cinematic, documentary, etc.)
-- Video generation takes 1-5 minutes, so set expectations
-- Duration can be 4 or 6 seconds
-
-Always confirm the output file path after generation.
-Save videos to the '{args.output_dir}' directory.""",
+            system_prompt=f"{SYSTEM_PROMPT_STATIC}\nSave videos to the '{args.output_dir}' directory.",
         )
 
+        # The video tools share one genai client; warm it while the user types
+        preconnect(os.getenv("GOOGLE_API_KEY"))
+
         generation_count = 0
         while True:
             try:
@@ -170,35 +195,49 @@ Save videos to the '{args.output_dir}' directory.""",
             metrics.set_stats("generation_count", generation_count)
 
     elif args.image:
-        # Image-to-video mode
-        print(f"Generating video from image: {args.image}")
+        # Image-to-video mode (several images are generated concurrently)
+        from src.tools.gemini_video import generate_video_from_image
+
+        print(f"Generating {len(args.image)} video(s) from image(s): {', '.join(args.image)}")
         print(f"Prompt: {args.prompt}")
         print("This may take 1-5 minutes...")
 
-        result = generate_video_from_image(
-            prompt=args.prompt,
-            image_path=args.image,
-            output_dir=args.output_dir,
-            duration_seconds=args.duration,
-            max_wait_seconds=args.max_wait,
-        )
-
-        if result["success"]:
-            print(f"Success! Video saved to: {result['file_path']}")
-            print(f"Duration: {result['duration']}s")
-            success = True
-            if metrics:
-                metrics.set_stats("operation", "image_to_video")
-                metrics.set_stats("output_file", result["file_path"])
-                metrics.set_stats("source_image", args.image)
-                metrics.set_stats("duration_seconds", result["duration"])
-        else:
-            print(f"Error: {result.get('error', 'Unknown error')}")
-            if metrics:
-                metrics.set_stats("error", result.get("error"))
+        # Veo jobs are long-running remote operations, so threads overlap the polling
+        with ThreadPoolExecutor(max_workers=max(1, min(args.concurrency, len(args.image)))) as executor:
+            results = list(executor.map(
+                lambda image: generate_video_from_image(
+                    prompt=args.prompt,
+                    image_path=image,
+                    output_dir=args.output_dir,
+                    duration_seconds=args.duration,
+                    max_wait_seconds=args.max_wait,
+                ),
+                args.image,
+            ))
+
+        for image, result in zip(args.image, results):
+            if result["success"]:
+                print(f"Success! Video for {image} saved to: {result['file_path']}")
+                print(f"Duration: {result['duration']}s")
+            else:
+                print(f"Error for {image}: {result.get('error', 'Unknown error')}")
+
+        success = all(r["success"] for r in results)
+        if metrics:
+            metrics.update({
+                "operation": "image_to_video",
+                "output_files": [r["file_path"] for r in results if r["success"]],
+                "source_images": args.image,
+                "duration_seconds": args.duration,
+            })
+            errors = [r.get("error") for r in results if not r["success"]]
+            if errors:
+                metrics.set_stats("errors", errors)
 
     else:
         # Direct text-to-video mode
+        from src.tools.gemini_video import generate_video
+
         print(f"Generating video...")
         print(f"Prompt: {args.prompt}")
         print(f"Duration: {args.duration}s")
@@ -216,24 +255,31 @@ Save videos to the '{args.output_dir}' directory.""",
             print(f"Duration: {result['duration']}s")
             success = True
             if metrics:
-                metrics.set_stats("operation", "text_to_video")
-                metrics.set_stats("output_file", result["file_path"])
-                metrics.set_stats("prompt", args.prompt)
-                metrics.set_stats("duration_seconds", result["duration"])
+                metrics.update({
+                    "operation": "text_to_video",
+                    "output_file": result["file_path"],
+                    "prompt": args.prompt,
+                    "duration_seconds": result["duration"],
+                })
         else:
             print(f"Error: {result.get('error', 'Unknown error')}")
             if metrics:
                 metrics.set_stats("error", result.get("error"))
 
-    # Export metrics and record run
-    if metrics:
-        elapsed = time.time() - start_time
-        metrics.set_timing("total_duration", elapsed)
-        metrics_path = metrics.export()
-        print(f"Metrics saved to: {metrics_path}")
+    # Export metrics and record run; the export (local file or S3 put)
+    # runs in the background while the registry is updated
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        export_future = None
+        if metrics:
+            elapsed = time.time() - start_time
+            metrics.set_timing("total_duration", elapsed)
+            export_future = executor.submit(metrics.export)
+
+        if registry:
+            registry.record_run(agent_id=AGENT_ID, run_id=run_id, success=success)
 
-    if registry:
-        registry.record_run(agent_id=AGENT_ID, run_id=run_id, success=success)
+        if export_future:
+            print(f"Metrics saved to: {export_future.result()}")
 
 
 if __name__ == "__main__":
@@ -13,12 +13,13 @@ Includes hub integration for session tracking and metrics.
 import os
 import sys
 import argparse
+import binascii
+import functools
 import time
-from pathlib import Path
 
-# Add repo root to path for imports
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
+# Add repo root to path for imports (set STRANDS_REPO_ROOT if examples/ is symlinked)
+REPO_ROOT = os.getenv("STRANDS_REPO_ROOT") or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -37,6 +38,22 @@ from src.hub.session import generate_run_id
 AGENT_ID = "gemini-video-understanding"
 AGENT_NAME = "Gemini Video Understanding"
 
+_PATCH_APPLIED = False
+
+
+# Signatures recur on every later turn of a conversation, so each one is
+# encoded/decoded once rather than on every streamed chunk and request.
+@functools.lru_cache(maxsize=256)
+def _enc_sig(sig: bytes) -> str:
+    """Base64-encode a thought signature for transport through the stream state."""
+    return binascii.b2a_base64(sig, newline=False).decode("ascii")
+
+
+@functools.lru_cache(maxsize=256)
+def _dec_sig(sig_b64: str) -> bytes:
+    """Decode a base64 thought signature back to the raw bytes Gemini expects."""
+    return binascii.a2b_base64(sig_b64)
+
 
 def _apply_gemini3_thought_signature_workaround() -> None:
     """
@@ -51,7 +68,9 @@ def _apply_gemini3_thought_signature_workaround() -> None:
     IMPORTANT: The signature must be preserved as raw bytes throughout - any string
     encoding/decoding round-trips will corrupt it.
     """
-    import base64
+    global _PATCH_APPLIED
+    if _PATCH_APPLIED:
+        return
 
     try:
         from google import genai as _genai  # type: ignore
@@ -70,23 +89,23 @@ def _apply_gemini3_thought_signature_workaround() -> None:
                 sig = getattr(part, "thought_signature", None) if part is not None else None
                 if sig:
                     # Preserve signature as base64 to avoid corruption during transport
+                    sig_raw = None
                     if isinstance(sig, (bytes, bytearray)):
-                        sig_b64 = base64.b64encode(sig).decode("ascii")
+                        sig_raw = bytes(sig)
+                        sig_b64 = _enc_sig(sig_raw)
                     else:
                         # If it's already a string, assume it might be base64 or preserve as-is
                         sig_b64 = str(sig)
-                    return {
-                        "contentBlockStart": {
-                            "start": {
-                                "toolUse": {
-                                    "name": part.function_call.name,
-                                    "toolUseId": part.function_call.name,
-                                    "signature": sig_b64,
-                                    "signature_is_b64": True,
-                                }
-                            }
-                        }
+                    tool_use = {
+                        "name": part.function_call.name,
+                        "toolUseId": part.function_call.name,
+                        "signature": sig_b64,
+                        "signature_is_b64": True,
                     }
+                    if sig_raw is not None:
+                        # In-process turns reuse the raw bytes; the base64 copy survives session serialization
+                        tool_use["signature_bytes"] = sig_raw
+                    return {"contentBlockStart": {"start": {"toolUse": tool_use}}}
             return strands_gemini.GeminiModel._orig_format_chunk(self, event)  # type: ignore[attr-defined]
 
         strands_gemini.GeminiModel._format_chunk = _patched_format_chunk  # type: ignore[method-assign]
@@ -97,13 +116,16 @@ def _apply_gemini3_thought_signature_workaround() -> None:
 
         def _patched_handle_content_block_start(event):  # type: ignore[no-untyped-def]
             current = strands_streaming._orig_handle_content_block_start(event)  # type: ignore[attr-defined]
-            start = event.get("start", {})
-            tool_use = start.get("toolUse")
-            if tool_use and isinstance(current, dict):
-                if tool_use.get("signature"):
-                    current["signature"] = tool_use["signature"]
-                if tool_use.get("signature_is_b64"):
-                    current["signature_is_b64"] = tool_use["signature_is_b64"]
+            # Fast path: text blocks carry no toolUse
+            start = event.get("start")
+            tool_use = start.get("toolUse") if start else None
+            if not tool_use or not isinstance(current, dict):
+                return current
+            get = tool_use.get
+            for key in ("signature", "signature_is_b64", "signature_bytes"):
+                value = get(key)
+                if value:
+                    current[key] = value
             return current
 
         strands_streaming.handle_content_block_start = _patched_handle_content_block_start  # type: ignore[assignment]
@@ -112,21 +134,25 @@ def _apply_gemini3_thought_signature_workaround() -> None:
         strands_streaming._orig_handle_content_block_stop = strands_streaming.handle_content_block_stop  # type: ignore[attr-defined]
 
         def _patched_handle_content_block_stop(state):  # type: ignore[no-untyped-def]
+            # Fast path: nothing to carry over unless a signed tool use is in progress
+            current_tool = state.get("current_tool_use")
+            sig = current_tool.get("signature") if isinstance(current_tool, dict) else None
+            if not sig:
+                return strands_streaming._orig_handle_content_block_stop(state)  # type: ignore[attr-defined]
+
             # Capture signature before stop finalizes and resets state
-            sig = None
-            sig_is_b64 = False
-            try:
-                current_tool = state.get("current_tool_use") or {}
-                sig = current_tool.get("signature")
-                sig_is_b64 = current_tool.get("signature_is_b64", False)
-            except Exception:
-                sig = None
+            sig_is_b64 = current_tool.get("signature_is_b64", False)
+            sig_raw = current_tool.get("signature_bytes")
             new_state = strands_streaming._orig_handle_content_block_stop(state)  # type: ignore[attr-defined]
-            if sig and new_state.get("message") and new_state["message"].get("content"):
-                last = new_state["message"]["content"][-1]
-                if "toolUse" in last and isinstance(last["toolUse"], dict) and "signature" not in last["toolUse"]:
-                    last["toolUse"]["signature"] = sig
-                    last["toolUse"]["signature_is_b64"] = sig_is_b64
+            message = new_state.get("message")
+            if message and message.get("content"):
+                last = message["content"][-1]
+                tool_use = last.get("toolUse")
+                if isinstance(tool_use, dict) and "signature" not in tool_use:
+                    tool_use["signature"] = sig
+                    tool_use["signature_is_b64"] = sig_is_b64
+                    if sig_raw:
+                        tool_use["signature_bytes"] = sig_raw
             return new_state
 
         strands_streaming.handle_content_block_stop = _patched_handle_content_block_stop  # type: ignore[assignment]
@@ -141,12 +167,15 @@ def _apply_gemini3_thought_signature_workaround() -> None:
             if "toolUse" in content:
                 tool_use = content["toolUse"]
                 sig = tool_use.get("signature")
-                if sig:
-                    # Decode base64 back to original bytes if needed
+                sig_raw = tool_use.get("signature_bytes")
+                if sig or sig_raw:
+                    # Prefer the raw bytes; decode base64 only for state restored from a session
                     sig_is_b64 = tool_use.get("signature_is_b64", False)
-                    if sig_is_b64 and isinstance(sig, str):
+                    if isinstance(sig_raw, bytes):
+                        sig_bytes = sig_raw
+                    elif sig_is_b64 and isinstance(sig, str):
                         try:
-                            sig_bytes = base64.b64decode(sig)
+                            sig_bytes = _dec_sig(sig)
                         except Exception:
                             sig_bytes = sig.encode("utf-8")
                     elif isinstance(sig, (bytes, bytearray)):
@@ -166,19 +195,25 @@ def _apply_gemini3_thought_signature_workaround() -> None:
 
         strands_gemini.GeminiModel._format_request_content_part = _patched_format_request_content_part  # type: ignore[method-assign]
 
+    _PATCH_APPLIED = True
+
+
+# Escape backslashes and quotes for values embedded in quoted tool arguments
+_ESCAPE_TABLE = str.maketrans({'"': '\\"', "\\": "\\\\"})
+
 
-def _build_single_turn_prompt(args: argparse.Namespace) -> str:
+def _build_source_str(args: argparse.Namespace) -> str:
     source_parts = []
     if args.youtube_url:
-        source_parts.append(f'youtube_url="{args.youtube_url}"')
+        source_parts.append(f'youtube_url="{args.youtube_url.translate(_ESCAPE_TABLE)}"')
     if args.video_path:
-        source_parts.append(f'video_path="{args.video_path}"')
+        source_parts.append(f'video_path="{args.video_path.translate(_ESCAPE_TABLE)}"')
+    return ", ".join(source_parts)
 
-    # Escape quotes in the prompt for safe embedding
-    escaped_prompt = args.prompt.replace('"', '\\"')
 
+def _build_static_kwargs_suffix(args: argparse.Namespace) -> str:
+    """Tool kwargs that stay fixed for the whole session (everything but the prompt)."""
     tool_kwargs = [
-        f'prompt="{escaped_prompt}"',
         f'model="{args.model}"',
         f"use_file_api={str(args.use_file_api).lower()}",
     ]
@@ -192,16 +227,22 @@ def _build_single_turn_prompt(args: argparse.Namespace) -> str:
         tool_kwargs.append(f'media_resolution="{args.media_resolution}"')
     if args.thinking_level is not None:
         tool_kwargs.append(f'thinking_level="{args.thinking_level}"')
+    return ", ".join(tool_kwargs)
 
-    source_str = ", ".join(source_parts)
-    kwargs_str = ", ".join(tool_kwargs)
 
-    return f"""Use the understand_video tool exactly once with {source_str}, {kwargs_str}.
+def _build_system_prompt(source_str: str, static_suffix: str) -> str:
+    """System prompt with the session's fixed video source and tool options baked in."""
+    return f"""You are a video understanding assistant.
 
-Then answer the user with the tool result, as plain text.
+You have one tool:
+- understand_video: Analyze a video (YouTube URL or local file) and return text answers.
+
+For every user message, call the understand_video tool exactly once with {source_str}, {static_suffix},
+and prompt set to the user's message verbatim.
 
-User question/instructions:
-{args.prompt}
+Rules:
+- Put the user's question AFTER the video part (the tool already does this correctly).
+- Answer the user with the tool result, as plain text.
 """
 
 
@@ -305,7 +346,9 @@ def main() -> None:
         raise SystemExit("Please set GOOGLE_API_KEY.")
 
     # Apply workaround early so Gemini 3 can tool-call without missing thought signatures.
-    _apply_gemini3_thought_signature_workaround()
+    # Other agent models never see signatures, so they skip the patch and its imports.
+    if args.agent_model.startswith("gemini-3"):
+        _apply_gemini3_thought_signature_workaround()
 
     if bool(args.youtube_url) == bool(args.video_path):
         raise SystemExit("Provide exactly one of --youtube-url or --video-path.")
@@ -344,20 +387,16 @@ def main() -> None:
     # The tool itself still uses Gemini 3 (args.model).
     agent_llm = gemini_model(model_id=args.agent_model)
 
+    # Only the prompt changes between turns; the video source and tool options are fixed,
+    # so they live in the system prompt and each turn sends just the user's question
+    source_str = _build_source_str(args)
+    static_suffix = _build_static_kwargs_suffix(args)
+
     agent = Agent(
         model=agent_llm,
         tools=[understand_video],
         session_manager=session_manager,
-        system_prompt=f"""You are a video understanding assistant.
-
-You have one tool:
-- understand_video: Analyze a video (YouTube URL or local file) and return text answers.
-
-Rules:
-- Use the understand_video tool when the user asks about video content.
-- Put the user's question AFTER the video part (the tool already does this correctly).
-- Return the final answer as plain text.
-""",
+        system_prompt=_build_system_prompt(source_str, static_suffix),
         name=AGENT_NAME,
     )
 
@@ -379,8 +418,7 @@ Rules:
 
                 # In interactive mode we keep the video source fixed from CLI flags,
                 # and let the user change only the prompt/question.
-                args.prompt = user_input
-                response = agent(_build_single_turn_prompt(args))
+                response = agent(user_input)
                 print(f"\nAgent: {response}")
                 question_count += 1
 
@@ -390,30 +428,35 @@ Rules:
         if metrics:
             metrics.set_stats("question_count", question_count)
     else:
-        response = agent(_build_single_turn_prompt(args))
+        response = agent(args.prompt)
         print(response)
         success = True
         if metrics:
             metrics.set_stats("question_count", 1)
 
     if metrics:
-        metrics.set_stats("tool_model", args.model)
-        metrics.set_stats("use_file_api", bool(args.use_file_api))
-        metrics.set_stats("source_type", "youtube_url" if args.youtube_url else "video_path")
+        stats = {
+            "tool_model": args.model,
+            "use_file_api": bool(args.use_file_api),
+            "source_type": "youtube_url" if args.youtube_url else "video_path",
+        }
         if args.youtube_url:
-            metrics.set_stats("youtube_url", args.youtube_url)
+            stats["youtube_url"] = args.youtube_url
         if args.video_path:
-            metrics.set_stats("video_path", args.video_path)
-        if args.start_offset_seconds is not None:
-            metrics.set_stats("start_offset_seconds", args.start_offset_seconds)
-        if args.end_offset_seconds is not None:
-            metrics.set_stats("end_offset_seconds", args.end_offset_seconds)
-        if args.fps is not None:
-            metrics.set_stats("fps", args.fps)
-        if args.media_resolution is not None:
-            metrics.set_stats("media_resolution", args.media_resolution)
-        if args.thinking_level is not None:
-            metrics.set_stats("thinking_level", args.thinking_level)
+            stats["video_path"] = args.video_path
+        # Optional tool options are recorded only when set
+        stats.update({
+            key: value
+            for key, value in (
+                ("start_offset_seconds", args.start_offset_seconds),
+                ("end_offset_seconds", args.end_offset_seconds),
+                ("fps", args.fps),
+                ("media_resolution", args.media_resolution),
+                ("thinking_level", args.thinking_level),
+            )
+            if value is not None
+        })
+        metrics.update(stats)
 
     if metrics:
         elapsed = time.time() - start_time
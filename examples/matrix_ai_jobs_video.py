@@ -12,13 +12,15 @@ Scene 3: Human "unplugging" from the old work paradigm
 Requires: GOOGLE_API_KEY environment variable
 """
 
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-# Add repo root to path for imports
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
+# Add repo root to path for imports (set STRANDS_REPO_ROOT if examples/ is symlinked)
+REPO_ROOT = os.getenv("STRANDS_REPO_ROOT") or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -109,18 +111,27 @@ def main():
     (OUTPUT_DIR / "clips").mkdir(exist_ok=True)
 
     total_start = time.time()
-    generated_clips = []
-
-    # Generate all 3 scenes
-    for i, scene in enumerate(SCENES, 1):
-        print(f"\n[{i}/{len(SCENES)}] Processing scene...")
-        result = generate_scene(scene, duration=6)
-
-        if result["success"]:
-            generated_clips.append(result["file_path"])
-        else:
-            print(f"\nError generating {scene['name']}: {result.get('error')}")
-            print("Continuing with remaining scenes...")
+
+    # Generate all 3 scenes concurrently; each is an independent Veo job that
+    # spends its 2-5 minutes polling, so threads overlap the waits
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(SCENES)) as executor:
+        futures = {executor.submit(generate_scene, scene, 6): scene for scene in SCENES}
+        for done, future in enumerate(as_completed(futures), 1):
+            scene = futures[future]
+            result = future.result()
+            results[scene["name"]] = result
+            print(f"\n[{done}/{len(SCENES)}] Finished {scene['name']}")
+            if not result["success"]:
+                print(f"\nError generating {scene['name']}: {result.get('error')}")
+                print("Continuing with remaining scenes...")
+
+    # Concatenate in story order, not completion order
+    generated_clips = [
+        results[scene["name"]]["file_path"]
+        for scene in SCENES
+        if results[scene["name"]]["success"]
+    ]
 
     # Check if we have clips to concatenate
     if len(generated_clips) < 2:
@@ -9,9 +9,17 @@ Usage:
     python mcp_docs_agent.py
 """
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 
+try:
+    import readline  # noqa: F401 - line editing and history for input()
+except ImportError:  # Windows
+    pass
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -21,14 +29,15 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from strands import Agent
-from strands.agent.conversation_manager import SlidingWindowConversationManager
 from mcp import stdio_client, StdioServerParameters
+from strands.tools.executors import ConcurrentToolExecutor, SequentialToolExecutor
 from strands.tools.mcp import MCPClient
 from strands_tools import shell, editor, current_time
 from pprint import pprint
 
 from models import anthropic_model
-from hooks import LoggingHook
+from hooks import LoggingHook, ToolCacheHook
+from conversation import AppendOnlyWindowManager
 from hub import (
     create_session_manager,
     MetricsExporter,
@@ -67,6 +76,11 @@ to find accurate, up-to-date information.
 
 MODEL = anthropic_model(model_id="claude-sonnet-4-5-20250929")
 
+# Agent already runs tool calls from one model turn concurrently by default.
+# Set PARALLEL_TOOLS=false to opt out and run them one at a time.
+PARALLEL_TOOLS = os.getenv("PARALLEL_TOOLS", "true").lower() == "true"
+TOOL_EXECUTOR = ConcurrentToolExecutor() if PARALLEL_TOOLS else SequentialToolExecutor()
+
 # =============================================================================
 # HUB INTEGRATION
 # =============================================================================
@@ -92,8 +106,9 @@ system_prompt = prompt_manager.get_current()
 
 # Session and conversation managers
 session_manager = create_session_manager(agent_id=AGENT_ID, run_id=run_id)
-conversation_manager = SlidingWindowConversationManager(
-    window_size=20,
+conversation_manager = AppendOnlyWindowManager(
+    min_window=20,
+    max_window=40,
     should_truncate_results=True,
 )
 
@@ -108,6 +123,13 @@ metrics = MetricsExporter(
 # MCP CLIENTS
 # =============================================================================
 
+DOC_TOOLS = {
+    "search_agentcore_docs",
+    "fetch_agentcore_doc",
+    "search_docs",
+    "fetch_doc",
+}
+
 agentcore_mcp_client = MCPClient(lambda: stdio_client(
     StdioServerParameters(
         command="uvx",
@@ -130,17 +152,57 @@ strands_mcp_client = MCPClient(lambda: stdio_client(
     )
 ))
 
+MCP_CLIENTS = (agentcore_mcp_client, strands_mcp_client)
+
+
+def start_mcp_clients(stack: ExitStack, clients=MCP_CLIENTS) -> list:
+    """
+    Start MCP clients concurrently and return their combined tools.
+
+    Each client launches its own uvx subprocess, so starting them side by side
+    overlaps the cold starts. Each worker lists its client's tools as soon as
+    that client is up, without waiting for the slower one. Started clients are
+    registered on the stack and stopped when it closes, even if another client
+    failed to start.
+    """
+    started = set()
+
+    def start_and_list(client):
+        client.__enter__()
+        started.add(client)
+        return client.list_tools_sync()
+
+    # Leaving the executor waits for every worker, so cleanup covers all started clients
+    with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+        futures = [executor.submit(start_and_list, client) for client in clients]
+
+    for client in clients:
+        if client in started:
+            stack.push(client)
+    return [tool for future in futures for tool in future.result()]
+
+# =============================================================================
+# REPL COMMANDS
+# =============================================================================
+
+COMMANDS = {
+    "model": lambda agent: print(f"Model: {agent.model.config}"),
+    "metrics": lambda agent: pprint(agent.event_loop_metrics),
+    "tools": lambda agent: print(f"Tools: {agent.tool_names}"),
+    "name": lambda agent: print(f"Name: {agent.name}"),
+}
+EXIT = {"exit", "quit", "q", ":q"}
+
+_RULE = "-" * 60
+
 # =============================================================================
 # MAIN
 # =============================================================================
 
 if __name__ == "__main__":
-    with agentcore_mcp_client, strands_mcp_client:
-        # Get tools from MCP servers
-        mcp_tools = (
-            agentcore_mcp_client.list_tools_sync() +
-            strands_mcp_client.list_tools_sync()
-        )
+    with ExitStack() as stack:
+        # Start both MCP servers and get their tools
+        mcp_tools = start_mcp_clients(stack)
 
         agent = Agent(
             model=MODEL,
@@ -148,16 +210,24 @@ if __name__ == "__main__":
             tools=[shell, current_time, editor] + mcp_tools,
             session_manager=session_manager,
             conversation_manager=conversation_manager,
-            hooks=[LoggingHook()],
+            tool_executor=TOOL_EXECUTOR,
+            hooks=[
+                LoggingHook(),
+                # Doc search/fetch tools are read-only, so repeat calls reuse the first result
+                ToolCacheHook(tools=DOC_TOOLS),
+            ],
             name=AGENT_NAME,
         )
 
-        print(f"\n{AGENT_NAME}")
-        print(f"Run ID: {run_id}")
-        print("-" * 60)
-        print("MCP Servers: AgentCore, Strands")
-        print("Commands: exit, model, metrics, tools, name")
-        print("-" * 60 + "\n")
+        sys.stdout.write(
+            f"\n{AGENT_NAME}\n"
+            f"Run ID: {run_id}\n"
+            f"{_RULE}\n"
+            "MCP Servers: AgentCore, Strands\n"
+            "Commands: exit, model, metrics, tools, name\n"
+            f"{_RULE}\n\n"
+        )
+        sys.stdout.flush()
 
         last_result = None
 
@@ -168,30 +238,24 @@ if __name__ == "__main__":
                 print("\n")
                 break
 
-            if not prompt.strip():
+            prompt = prompt.strip()
+            if not prompt:
                 continue
 
-            if prompt in ("exit", "quit"):
+            command = prompt.lower()
+            if command in EXIT:
                 break
 
-            if prompt == "model":
-                print(f"Model: {agent.model.config}")
-                continue
-
-            if prompt == "metrics":
-                pprint(agent.event_loop_metrics)
-                continue
-
-            if prompt == "tools":
-                print(f"Tools: {agent.tool_names}")
-                continue
-
-            if prompt == "name":
-                print(f"Name: {agent.name}")
+            handler = COMMANDS.get(command)
+            if handler:
+                handler(agent)
                 continue
 
+            # The default callback handler streams text to stdout as it is generated,
+            # so the reply is already on screen when the call returns
             last_result = agent(prompt)
-            print(f"\n{last_result}\n")
+            sys.stdout.write("\n\n")
+            sys.stdout.flush()
 
         # Export metrics
         print("Exporting metrics...")
@@ -6,23 +6,27 @@ A production-ready agent template integrating all framework features:
 - Hub integration (sessions, metrics, prompts, registry)
 - Custom hooks for logging and monitoring
 - Auto-loaded tools from src/tools/
-- Conversation management with sliding window
+- Conversation management with a cache-friendly sliding window
 
 Customize the configuration section below and start building.
 """
 
+import os
+import sys
+
 from dotenv import load_dotenv
 
 # Load environment variables FIRST (before hub imports)
 load_dotenv()
 
 from strands import Agent  # noqa: E402
-from strands.agent.conversation_manager import SlidingWindowConversationManager  # noqa: E402
+from strands.tools.executors import ConcurrentToolExecutor, SequentialToolExecutor  # noqa: E402
 from strands_tools import shell, editor, current_time  # noqa: E402
 from pprint import pprint  # noqa: E402
 
 from models import anthropic_model  # noqa: E402
 from hooks import LoggingHook  # noqa: E402
+from conversation import AppendOnlyWindowManager  # noqa: E402
 from hub import (  # noqa: E402
     create_session_manager,
     MetricsExporter,
@@ -52,6 +56,12 @@ SYSTEM_PROMPT = DEMO_AGENT_PROMPT
 #   ollama_model(model_id="llama3.1:latest")
 MODEL = anthropic_model(model_id="claude-sonnet-4-5-20250929")
 
+# Tool execution - Agent already runs tool calls from one model turn concurrently
+# by default. Set PARALLEL_TOOLS=false to opt out and run them one at a time
+# (e.g. tools sharing state).
+PARALLEL_TOOLS = os.getenv("PARALLEL_TOOLS", "true").lower() == "true"
+TOOL_EXECUTOR = ConcurrentToolExecutor() if PARALLEL_TOOLS else SequentialToolExecutor()
+
 
 # =============================================================================
 # HUB INTEGRATION - Sessions, metrics, prompts, and registry
@@ -80,9 +90,11 @@ system_prompt = prompt_manager.get_current()
 # Session manager (S3 or local based on USE_S3 env var)
 session_manager = create_session_manager(agent_id=AGENT_ID, run_id=run_id)
 
-# Conversation manager with sliding window
-conversation_manager = SlidingWindowConversationManager(
-    window_size=20,  # Number of messages to keep in context
+# Conversation manager with a sliding window that trims in steps, so the
+# message history stays a stable (prompt-cacheable) prefix between trims
+conversation_manager = AppendOnlyWindowManager(
+    min_window=20,  # Messages kept after a trim
+    max_window=40,  # Messages allowed before trimming back to min_window
     should_truncate_results=True,
 )
 
@@ -104,6 +116,7 @@ agent = Agent(
     tools=[shell, current_time, editor],  # Add your tools here
     session_manager=session_manager,
     conversation_manager=conversation_manager,
+    tool_executor=TOOL_EXECUTOR,
     hooks=[LoggingHook(verbose=True)],  # Set verbose=False to reduce output
     name=AGENT_NAME,
     load_tools_from_directory=True,  # Auto-loads tools from src/tools/
@@ -114,13 +127,28 @@ agent = Agent(
 # MAIN LOOP
 # =============================================================================
 
+# Built-in commands are answered locally, never sent to the model
+COMMANDS = {
+    "model": lambda agent: print(f"Model: {agent.model.config}"),
+    "metrics": lambda agent: pprint(agent.event_loop_metrics),
+    "tools": lambda agent: print(f"Tools: {agent.tool_names}"),
+    "name": lambda agent: print(f"Name: {agent.name}"),
+}
+EXIT = {"exit", "quit", "q", ":q"}
+
+_RULE = "-" * 60
+
+
 def main():
     """Run the interactive agent loop."""
-    print(f"\n{AGENT_NAME}")
-    print(f"Run ID: {run_id}")
-    print("-" * 60)
-    print("Commands: exit, model, metrics, tools, name")
-    print("-" * 60 + "\n")
+    sys.stdout.write(
+        f"\n{AGENT_NAME}\n"
+        f"Run ID: {run_id}\n"
+        f"{_RULE}\n"
+        "Commands: exit, model, metrics, tools, name\n"
+        f"{_RULE}\n\n"
+    )
+    sys.stdout.flush()
 
     last_result = None
 
@@ -131,32 +159,26 @@ def main():
             print("\n")
             break
 
-        if not prompt.strip():
+        prompt = prompt.strip()
+        if not prompt:
             continue
 
-        if prompt in ("exit", "quit"):
+        command = prompt.lower()
+        if command in EXIT:
             break
 
         # Built-in commands
-        if prompt == "model":
-            print(f"Model: {agent.model.config}")
-            continue
-
-        if prompt == "metrics":
-            pprint(agent.event_loop_metrics)
-            continue
-
-        if prompt == "tools":
-            print(f"Tools: {agent.tool_names}")
-            continue
-
-        if prompt == "name":
-            print(f"Name: {agent.name}")
+        handler = COMMANDS.get(command)
+        if handler:
+            handler(agent)
             continue
 
         # Run agent
+        # The default callback handler streams text to stdout as it is generated,
+        # so the reply is already on screen when the call returns
         last_result = agent(prompt)
-        print(f"\n{last_result}\n")
+        sys.stdout.write("\n\n")
+        sys.stdout.flush()
 
     # Export metrics on exit
     print("Exporting metrics...")
@@ -0,0 +1,7 @@
+"""
+Conversation - Custom conversation managers for Strands agents.
+"""
+
+from .append_only_window import AppendOnlyWindowManager
+
+__all__ = ["AppendOnlyWindowManager"]
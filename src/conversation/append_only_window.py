@@ -0,0 +1,60 @@
+"""
+Append-Only Window - Sliding window that keeps the message prefix stable.
+
+SlidingWindowConversationManager drops the oldest messages on every turn
+once the window is full, so each request starts from a different message
+and provider prompt caching (Anthropic, OpenAI, Gemini) never matches past
+the system prompt. This manager lets the history grow to max_window and
+then cuts it back to the most recent min_window messages in one step.
+Between cuts every request extends the previous one, so the whole history
+is a cacheable prefix.
+"""
+
+from typing import Any
+
+from strands.agent.conversation_manager import SlidingWindowConversationManager
+
+
+class AppendOnlyWindowManager(SlidingWindowConversationManager):
+    """
+    Sliding window that trims in large steps instead of one message per turn.
+
+    Trimming still goes through SlidingWindowConversationManager.reduce_context,
+    so tool-result truncation, toolUse/toolResult pairing and
+    removed_message_count (restored by session managers) behave as before.
+
+    Usage:
+        agent = Agent(conversation_manager=AppendOnlyWindowManager(min_window=20, max_window=40))
+    """
+
+    def __init__(
+        self,
+        min_window: int = 20,
+        max_window: int = 40,
+        should_truncate_results: bool = True,
+    ):
+        """
+        Initialize the window manager.
+
+        Args:
+            min_window: Messages kept after a trim.
+            max_window: Messages allowed before trimming back to min_window.
+            should_truncate_results: Truncate large tool results before dropping messages.
+        """
+        if min_window >= max_window:
+            raise ValueError("min_window must be less than max_window")
+
+        super().__init__(window_size=max_window, should_truncate_results=should_truncate_results)
+        self.min_window = min_window
+        self.max_window = max_window
+
+    def apply_management(self, agent: Any, **kwargs: Any) -> None:
+        """Leave the history untouched until it exceeds max_window, then trim to min_window."""
+        if len(agent.messages) <= self.max_window:
+            return
+
+        self.window_size = self.min_window
+        try:
+            self.reduce_context(agent)
+        finally:
+            self.window_size = self.max_window
@@ -3,5 +3,6 @@ Hooks - Custom hook providers for Strands agents.
 """
 
 from .logging_hook import LoggingHook
+from .tool_cache_hook import ToolCacheHook
 
-__all__ = ["LoggingHook"]
+__all__ = ["LoggingHook", "ToolCacheHook"]
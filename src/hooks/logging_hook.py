@@ -1,11 +1,26 @@
 """
 Logging Hook - Log tool invocations before execution.
+
+Formatting and printing run on a background thread, so the hook only
+enqueues the invocation and the tool starts without waiting on stdout.
 """
 
+import atexit
 import json
+import queue
+import sys
+import threading
 from strands.hooks import HookProvider, HookRegistry
 from strands.experimental.hooks import BeforeToolInvocationEvent
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_BAR = "=" * 60
+
 
 class LoggingHook(HookProvider):
     """
@@ -25,21 +40,57 @@ class LoggingHook(HookProvider):
         self.calls = 0
         self.verbose = verbose
 
+        self._queue: queue.Queue = queue.Queue()
+        threading.Thread(target=self._consume, name="logging-hook", daemon=True).start()
+        # Drain pending blocks before the interpreter exits
+        atexit.register(self._queue.join)
+
     def register_hooks(self, registry: HookRegistry) -> None:
         registry.add_callback(BeforeToolInvocationEvent, self.log_start)
 
     def log_start(self, event: BeforeToolInvocationEvent) -> None:
         self.calls += 1
-        print("=" * 60)
-        print(f"TOOL INVOCATION: {self.calls}")
-        print("=" * 60)
-        print(f"Agent: {event.agent.name}")
-        print(f"Tool: {event.tool_use['name']}")
+        self._queue.put((
+            self.calls,
+            event.agent.name,
+            event.tool_use["name"],
+            event.tool_use["input"] if self.verbose else None,
+        ))
+
+    def _consume(self) -> None:
+        """Format and print queued invocations."""
+        while True:
+            item = self._queue.get()
+            try:
+                sys.stdout.write(self._format(*item))
+                sys.stdout.flush()
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
+
+    def _format(self, call: int, agent_name: str, tool_name: str, tool_input) -> str:
+        # Build the whole block and write it once, so concurrent tool calls don't interleave lines
+        parts = [
+            _BAR,
+            f"TOOL INVOCATION: {call}",
+            _BAR,
+            f"Agent: {agent_name}",
+            f"Tool: {tool_name}",
+        ]
 
         if self.verbose:
-            print("Input Parameters:")
-            formatted_input = json.dumps(event.tool_use["input"], indent=2)
-            for line in formatted_input.split("\n"):
-                print(f"  {line}")
+            if HAS_ORJSON:
+                formatted_input = orjson.dumps(
+                    tool_input,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str,
+                ).decode()
+            else:
+                formatted_input = json.dumps(tool_input, indent=2, default=str)
+            parts.append("Input Parameters:")
+            # Indent every line in one C-level pass instead of splitting and rejoining
+            parts.append("  " + formatted_input.replace("\n", "\n  "))
 
-        print("=" * 60)
+        parts.append(_BAR)
+        return "\n".join(parts) + "\n"
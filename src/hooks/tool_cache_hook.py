@@ -0,0 +1,129 @@
+"""
+Tool Cache Hook - Reuse results of read-only tools called with the same input.
+"""
+
+import atexit
+import json
+import shelve
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from strands.hooks import HookProvider, HookRegistry
+from strands.experimental.hooks import AfterToolInvocationEvent, BeforeToolInvocationEvent
+from strands.tools.tools import PythonAgentTool
+
+
+class ToolCacheHook(HookProvider):
+    """
+    Hook that memoizes successful results of deterministic, read-only tools.
+
+    Only the tools named in `tools` are cached; anything with side effects
+    (shell, editor, ...) must be left out. On a repeat call with the same
+    input the selected tool is swapped for one that returns the stored
+    result, so the real tool (e.g. an MCP stdio round trip) never runs.
+
+    Usage:
+        agent = Agent(hooks=[ToolCacheHook(tools={"search_docs", "fetch_doc"})])
+    """
+
+    def __init__(
+        self,
+        tools: Iterable[str],
+        max_entries: int = 256,
+        persist_path: Optional[str] = None,
+    ):
+        """
+        Initialize the tool cache hook.
+
+        Args:
+            tools: Names of the tools whose results may be cached.
+            max_entries: In-memory LRU size.
+            persist_path: Optional shelve file to reuse results across runs
+                (e.g. ".agent_hub/tool_cache").
+        """
+        self.tools = frozenset(tools)
+        self.max_entries = max_entries
+        self.hits = 0
+        self._cache: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        # Stand-in tools handed out on a hit (by id, kept alive until their result comes back)
+        self._stand_ins: dict[int, PythonAgentTool] = {}
+        self._shelf = None
+        if persist_path:
+            self._shelf = shelve.open(persist_path)
+            atexit.register(self.close)
+
+    def register_hooks(self, registry: HookRegistry) -> None:
+        registry.add_callback(BeforeToolInvocationEvent, self.use_cached)
+        registry.add_callback(AfterToolInvocationEvent, self.store_result)
+
+    def use_cached(self, event: BeforeToolInvocationEvent) -> None:
+        key = self._key(event.tool_use)
+        if key is None or event.selected_tool is None:
+            return
+
+        cached = self._get(key)
+        if cached is None:
+            return
+
+        self.hits += 1
+        print(f"[CACHE HIT] {event.tool_use['name']}")
+        tool = event.selected_tool
+        stand_in = PythonAgentTool(
+            tool.tool_name,
+            tool.tool_spec,
+            lambda tool_use, **_: {**cached, "toolUseId": tool_use["toolUseId"]},
+        )
+        with self._lock:
+            self._stand_ins[id(stand_in)] = stand_in
+        event.selected_tool = stand_in
+
+    def store_result(self, event: AfterToolInvocationEvent) -> None:
+        # Results replayed from the cache are already stored
+        with self._lock:
+            if self._stand_ins.pop(id(event.selected_tool), None) is not None:
+                return
+
+        key = self._key(event.tool_use)
+        if key is None or not event.result or event.result.get("status") != "success":
+            return
+        self._put(key, event.result)
+
+    def close(self) -> None:
+        """Flush and close the persisted cache. Safe to call more than once."""
+        with self._lock:
+            if self._shelf is not None:
+                self._shelf.close()
+                self._shelf = None
+
+    def _key(self, tool_use: dict) -> Optional[str]:
+        """Cache key for a tool use: name plus canonical JSON input, or None if not cacheable."""
+        name = tool_use.get("name")
+        if name not in self.tools:
+            return None
+        return f"{name}:{json.dumps(tool_use.get('input'), sort_keys=True, default=str)}"
+
+    def _get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                return result
+            if self._shelf is not None and key in self._shelf:
+                result = self._shelf[key]
+                self._remember(key, result)
+            return result
+
+    def _put(self, key: str, result: dict) -> None:
+        with self._lock:
+            self._remember(key, result)
+            if self._shelf is not None:
+                self._shelf[key] = result
+                self._shelf.sync()
+
+    def _remember(self, key: str, result: dict) -> None:
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
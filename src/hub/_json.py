@@ -0,0 +1,57 @@
+"""
+JSON helpers shared by the hub modules.
+
+Uses orjson when it is installed (C encoder, returns bytes) and falls back
+to the standard library otherwise. Output is always indented two spaces so
+files in S3 and the local directory stay human-readable, except for small
+machine-only records written with dumps().
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if HAS_ORJSON:
+    _ORJSON_COMPACT = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _ORJSON_OPTIONS = _ORJSON_COMPACT | orjson.OPT_INDENT_2
+
+
+def default(obj: Any) -> Any:
+    """Fallback for values JSON can't encode: numpy scalars become numbers, the rest strings."""
+    if type(obj).__module__ == "numpy" and hasattr(obj, "item"):
+        return obj.item()
+    return str(obj)
+
+
+def strict_default(obj: Any) -> Any:
+    """Fallback for strict mode: numpy scalars become numbers, anything else is an error."""
+    if type(obj).__module__ == "numpy" and hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Value of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_pretty(obj: Any, strict: bool = False) -> bytes:
+    """Serialize to indented JSON bytes."""
+    fallback = strict_default if strict else default
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS, default=fallback)
+    return json.dumps(obj, indent=2, default=fallback).encode("utf-8")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_COMPACT, default=default)
+    return json.dumps(obj, default=default).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON bytes or text."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
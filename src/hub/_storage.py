@@ -0,0 +1,51 @@
+"""
+File and S3 body helpers shared by the hub modules.
+"""
+
+import gzip
+import os
+import threading
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write a file via a temp file and rename, so readers (and a crash
+    mid-write) never see a truncated file.
+
+    Args:
+        path: Final file path
+        data: File contents
+    """
+    # Unique per writer: processes and threads may write the same target concurrently
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# JSON documents smaller than this are sent as-is; gzip overhead outweighs the savings
+GZIP_MIN_BYTES = 2048
+
+
+def encode_body(data: bytes) -> tuple[bytes, dict]:
+    """
+    Gzip an S3 object body if it is large enough to benefit.
+
+    Returns:
+        The body and extra put_object arguments (ContentEncoding when compressed)
+    """
+    if len(data) < GZIP_MIN_BYTES:
+        return data, {}
+    return gzip.compress(data, compresslevel=6), {"ContentEncoding": "gzip"}
+
+
+def decode_body(response: dict) -> bytes:
+    """Read a get_object response body, undoing gzip ContentEncoding."""
+    body = response["Body"].read()
+    if response.get("ContentEncoding") == "gzip":
+        return gzip.decompress(body)
+    return body
@@ -2,6 +2,7 @@
 Hub Configuration - Load settings from environment variables.
 """
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -19,6 +20,8 @@ class HubConfig:
         AGENT_HUB_BUCKET: S3 bucket name
         AGENT_HUB_REGION: AWS region (default: us-east-1)
         AGENT_HUB_LOCAL_DIR: Local fallback directory
+        AGENT_HUB_STRICT_METRICS: Reject metric values that aren't JSON types (default: false)
+        AGENT_HUB_COMPRESS_PROMPTS: zstd-compress prompts uploaded to S3 (default: false)
     """
     
     # S3 settings
@@ -35,6 +38,16 @@ class HubConfig:
     # Local fallback
     local_dir: Path = field(default_factory=lambda: Path(os.getenv("AGENT_HUB_LOCAL_DIR", "./.agent_hub")))
     
+    # Metrics settings (strict: fail fast on unserializable values instead of str())
+    strict_metrics: bool = field(
+        default_factory=lambda: os.getenv("AGENT_HUB_STRICT_METRICS", "false").lower() == "true"
+    )
+    
+    # Prompt settings (compression needs the optional zstandard package)
+    compress_prompts: bool = field(
+        default_factory=lambda: os.getenv("AGENT_HUB_COMPRESS_PROMPTS", "false").lower() == "true"
+    )
+    
     # Cache settings
     prompt_cache_ttl_seconds: int = 3600  # 1 hour
     
@@ -83,3 +96,24 @@ def set_config(config: HubConfig) -> None:
     global _config
     _config = config
 
+
+@functools.cache
+def get_s3_client(region: str):
+    """
+    Get a shared boto3 S3 client for a region.
+
+    Building a client parses the service model and sets up a signer, so it
+    is done once per region and reused (boto3 clients are thread-safe).
+    The connection pool is sized for the hub's concurrent uploads.
+    """
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        "s3",
+        region_name=region,
+        config=Config(
+            max_pool_connections=50,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+        ),
+    )
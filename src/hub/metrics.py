@@ -2,14 +2,24 @@
 Metrics Export - Save run metrics to S3 or local storage.
 
 Supports offline-first workflow: saves locally, syncs to S3 when available.
+Every metric is also appended to a per-run JSONL journal as it is set, so
+a crashed run still leaves its partial metrics on disk (see fold()).
 """
 
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from .config import get_config
+from ._storage import atomic_write_bytes
+from ._json import default, dumps_pretty, loads, strict_default
+from .config import get_config, get_s3_client
+
+# Concurrent uploads when draining the sync queue
+SYNC_WORKERS = 16
 
 
 class MetricsExporter:
@@ -21,6 +31,9 @@ class MetricsExporter:
         exporter.set("total_jobs", 100)
         exporter.set("success_rate", 0.95)
         exporter.export()  # Saves to S3 or local
+
+        # Rebuild the metrics of a run that never reached export()
+        metrics = MetricsExporter.fold(journal_path)
     """
     
     def __init__(
@@ -33,20 +46,93 @@ class MetricsExporter:
         self.run_id = run_id
         self.prompt_version = prompt_version
         self.config = get_config()
+        self._default = strict_default if self.config.strict_metrics else default
+        
+        # Wall clock for timestamps, monotonic clock for the runtime
+        self._start_dt = datetime.now()
+        self._start_monotonic = time.perf_counter()
+        self._date_str = self._start_dt.strftime("%Y-%m-%d")
         
         # Initialize metrics
         self.metrics: dict[str, Any] = {
             "agent_id": agent_id,
             "run_id": run_id,
             "prompt_version": prompt_version,
-            "started_at": datetime.now().isoformat(),
+            "started_at": self._start_dt.isoformat(),
             "completed_at": None,
             "timing": {},
             "stats": {},
             "custom": {},
         }
         
+        # Category sub-dicts, so set() resolves a category with one dict lookup
+        self._buckets: dict[str, dict[str, Any]] = {
+            "timing": self.metrics["timing"],
+            "stats": self.metrics["stats"],
+            "custom": self.metrics["custom"],
+        }
+        
         self._exported = False
+
+        # Append-only journal: one line per metric write
+        date_dir = self.config.local_metrics_dir / self._date_str
+        date_dir.mkdir(parents=True, exist_ok=True)
+        self.journal_path = date_dir / f"{run_id}.jsonl"
+        fd = os.open(self.journal_path, os.O_CREAT | os.O_WRONLY | os.O_APPEND, 0o644)
+        self._journal = os.fdopen(fd, "a", buffering=1)
+
+        for key in ("agent_id", "run_id", "prompt_version", "started_at"):
+            self._append(None, key, self.metrics[key])
+
+    def _append(self, category: str | None, key: str, value: Any) -> None:
+        """Write one metric event to the journal."""
+        self._append_many(category, {key: value})
+
+    def _append_many(self, category: str | None, values: dict[str, Any]) -> None:
+        """
+        Write several metric events to the journal in a single write.
+
+        Serializes even when the journal is closed, so callers can rely on it
+        to reject values export() couldn't write (strict mode).
+        """
+        if not values:
+            return
+        now = time.time()
+        lines = "".join(
+            json.dumps({"t": now, "c": category, "k": key, "v": value}, default=self._default) + "\n"
+            for key, value in values.items()
+        )
+        if not self._journal.closed:
+            self._journal.write(lines)
+
+    @staticmethod
+    def fold(path: Path | str) -> dict:
+        """
+        Rebuild a metrics dict from a run's JSONL journal.
+
+        Args:
+            path: Journal file written by a MetricsExporter
+
+        Returns:
+            Metrics dict in the same shape export() writes
+        """
+        metrics: dict[str, Any] = {"timing": {}, "stats": {}, "custom": {}}
+
+        with open(path) as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from a crash
+                    continue
+
+                category = event.get("c")
+                if category in metrics:
+                    metrics[category][event["k"]] = event["v"]
+                else:
+                    metrics[event["k"]] = event["v"]
+
+        return metrics
     
     def set(self, key: str, value: Any, category: str = "custom") -> None:
         """
@@ -57,18 +143,40 @@ class MetricsExporter:
             value: Metric value
             category: One of "timing", "stats", "custom"
         """
-        if category in ("timing", "stats", "custom"):
-            self.metrics[category][key] = value
+        # Journal first: a value that fails to serialize is never stored
+        bucket = self._buckets.get(category)
+        if bucket is not None:
+            self._append(category, key, value)
+            bucket[key] = value
         else:
+            self._append(None, key, value)
             self.metrics[key] = value
     
     def set_timing(self, key: str, value: float) -> None:
         """Set a timing metric (seconds)."""
-        self.metrics["timing"][key] = value
+        self._append("timing", key, value)
+        self._buckets["timing"][key] = value
     
     def set_stats(self, key: str, value: Any) -> None:
         """Set a stats metric."""
-        self.metrics["stats"][key] = value
+        self._append("stats", key, value)
+        self._buckets["stats"][key] = value
+    
+    def update(self, values: dict[str, Any], category: str = "stats") -> None:
+        """
+        Set several metrics at once.
+        
+        Args:
+            values: Metric names and values
+            category: One of "timing", "stats", "custom"
+        """
+        bucket = self._buckets.get(category)
+        if bucket is not None:
+            self._append_many(category, values)
+            bucket.update(values)
+        else:
+            self._append_many(None, values)
+            self.metrics.update(values)
     
     def set_from_agent_result(self, result: Any) -> None:
         """
@@ -116,13 +224,14 @@ class MetricsExporter:
         Returns:
             Path (local) or S3 key where metrics were saved
         """
-        self.metrics["completed_at"] = datetime.now().isoformat()
-        
-        # Calculate duration if we have timing data
-        if self.metrics.get("started_at") and self.metrics.get("completed_at"):
-            start = datetime.fromisoformat(self.metrics["started_at"])
-            end = datetime.fromisoformat(self.metrics["completed_at"])
-            self.metrics["timing"]["total_runtime_seconds"] = (end - start).total_seconds()
+        end_dt = datetime.now()
+        self.metrics["completed_at"] = end_dt.isoformat()
+        self.metrics["timing"]["total_runtime_seconds"] = time.perf_counter() - self._start_monotonic
+        self._date_str = end_dt.strftime("%Y-%m-%d")
+
+        self._append(None, "completed_at", self.metrics["completed_at"])
+        self._append("timing", "total_runtime_seconds", self.metrics["timing"].get("total_runtime_seconds"))
+        self._close_journal()
         
         # Try S3 first
         if self.config.use_s3:
@@ -143,20 +252,29 @@ class MetricsExporter:
         
         return local_path
     
+    def _close_journal(self) -> None:
+        """
+        Close the journal.
+
+        Every append is already handed to the OS by the line-buffered file,
+        which is what survives a crashed process. No fsync is issued here:
+        the exported JSON written next is not fsynced either, and a
+        per-run fsync would be the slowest step on the exit path.
+        """
+        if not self._journal.closed:
+            self._journal.close()
+
     def _export_to_s3(self) -> str:
         """Export metrics to S3."""
-        import boto3
-        
-        s3 = boto3.client("s3", region_name=self.config.region)
+        s3 = get_s3_client(self.config.region)
         
         # Organize by date: metrics/2024-12-15/run_id.json
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        s3_key = f"{self.config.metrics_prefix}{date_str}/{self.run_id}.json"
+        s3_key = f"{self.config.metrics_prefix}{self._date_str}/{self.run_id}.json"
         
         s3.put_object(
             Bucket=self.config.bucket,
             Key=s3_key,
-            Body=json.dumps(self.metrics, indent=2, default=str),
+            Body=dumps_pretty(self.metrics, strict=self.config.strict_metrics),
             ContentType="application/json",
         )
         
@@ -164,14 +282,13 @@ class MetricsExporter:
     
     def _export_to_local(self) -> Path:
         """Export metrics to local file."""
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        date_dir = self.config.local_metrics_dir / date_str
+        date_dir = self.config.local_metrics_dir / self._date_str
         date_dir.mkdir(exist_ok=True)
         
         local_path = date_dir / f"{self.run_id}.json"
         
-        with open(local_path, "w") as f:
-            json.dump(self.metrics, f, indent=2, default=str)
+        # Never leave a truncated file for sync_pending to upload
+        atomic_write_bytes(local_path, dumps_pretty(self.metrics, strict=self.config.strict_metrics))
         
         return local_path
     
@@ -182,10 +299,16 @@ class MetricsExporter:
             f.write(f"{local_path}\n")
     
     @classmethod
-    def sync_pending(cls) -> int:
+    def sync_pending(cls, validate: bool = False) -> int:
         """
         Sync any pending local metrics to S3.
         
+        Queued files were written by export(), so their bytes are uploaded
+        as-is rather than parsed and re-serialized.
+        
+        Args:
+            validate: Parse each file before upload; corrupt files stay queued
+        
         Returns:
             Number of files synced
         """
@@ -199,25 +322,23 @@ class MetricsExporter:
             return 0
         
         try:
-            import boto3
-            s3 = boto3.client("s3", region_name=config.region)
+            s3 = get_s3_client(config.region)
         except Exception:
             return 0
         
-        synced = 0
-        remaining = []
-        
         with open(sync_queue, "r") as f:
             paths = [line.strip() for line in f if line.strip()]
         
-        for path_str in paths:
+        def upload_one(path_str: str) -> bool | None:
+            """Upload one queued file. Returns None if the file is gone."""
             path = Path(path_str)
             if not path.exists():
-                continue
+                return None
             
             try:
-                with open(path, "r") as f:
-                    metrics = json.load(f)
+                body = path.read_bytes()
+                if validate:
+                    loads(body)
                 
                 # Upload to S3
                 date_str = path.parent.name
@@ -227,13 +348,19 @@ class MetricsExporter:
                 s3.put_object(
                     Bucket=config.bucket,
                     Key=s3_key,
-                    Body=json.dumps(metrics, indent=2, default=str),
+                    Body=body,
                     ContentType="application/json",
                 )
-                
-                synced += 1
+                return True
             except Exception:
-                remaining.append(path_str)
+                return False
+        
+        # Uploads are network-bound, so overlap them (the S3 client is thread-safe)
+        with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as executor:
+            results = list(executor.map(upload_one, paths))
+        
+        synced = sum(1 for ok in results if ok)
+        remaining = [path_str for path_str, ok in zip(paths, results) if ok is False]
         
         # Update queue with remaining items
         if remaining:
@@ -3,15 +3,31 @@ System Prompt Management - Versioned prompt storage with S3 backend.
 
 Caches prompts locally to avoid fetching on every run.
 Only fetches from S3 when explicitly requested or cache expires.
+The current prompt is also kept in memory, so managers created again in
+the same process skip the cache files until the TTL runs out.
 """
 
 import hashlib
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
-from .config import get_config
+from ._storage import atomic_write_bytes, decode_body, encode_body
+from ._json import dumps, dumps_pretty, loads
+from .config import get_config, get_s3_client
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# In-process cache of current prompts: cache file path -> (content, cached_at)
+_memory_cache: dict[Path, tuple[str, float]] = {}
+
+# Prompt versions this process has seen in S3: (bucket, version key)
+_confirmed_in_s3: set[tuple[str, str]] = set()
 
 
 class S3PromptManager:
@@ -41,6 +57,12 @@ class S3PromptManager:
         
         self._cache_file = self.cache_dir / "current.txt"
         self._cache_meta = self.cache_dir / "cache_meta.json"
+        
+        # Independent S3 requests run concurrently (created on first use)
+        self._executor: ThreadPoolExecutor | None = None
+        
+        # Last versions.json written by this manager and its ETag
+        self._manifest_cache: tuple[dict, str] | None = None
     
     def get_current(
         self,
@@ -105,25 +127,44 @@ class S3PromptManager:
         Returns:
             The version that's now current
         """
-        # Check if this version already exists in S3
+        # Fast path: the version is known locally, this process has already
+        # confirmed it in S3 (when enabled), and current.txt is within the
+        # cache TTL - skip the S3 round trips
+        local_version = self.cache_dir / f"{version}.txt"
+        if (
+            local_version.exists()
+            and (not self.config.use_s3 or self._confirmed_in_s3(version))
+            and self._get_from_cache() is not None
+        ):
+            return version
+        
+        # Check if this version already exists in S3 (current.txt is fetched
+        # alongside, since it's needed whenever the version exists)
+        existing_in_s3 = None
+        checked_s3 = False
         if self.config.use_s3:
             try:
-                existing = self._fetch_from_s3(f"{version}.txt")
-                if existing:
+                executor = self._get_executor()
+                version_future = executor.submit(self._fetch_from_s3, f"{version}.txt")
+                current_future = executor.submit(self._fetch_from_s3, "current.txt")
+                
+                existing_in_s3 = version_future.result()
+                checked_s3 = True
+                if existing_in_s3:
+                    self._mark_in_s3(version)
                     # Version exists, check if it's current
-                    current = self._fetch_from_s3("current.txt")
+                    current = current_future.result()
                     if not current:
                         # No current set, make this one current
-                        self._upload_to_s3("current.txt", existing)
+                        self._copy_in_s3(f"{version}.txt", "current.txt", existing_in_s3)
                     return version
             except Exception:
                 pass
         
         # Check local
-        local_version = self.cache_dir / f"{version}.txt"
         if local_version.exists():
             # Already exists locally - but might not be in S3!
-            local_content = local_version.read_text()
+            local_content = local_version.read_bytes().decode("utf-8")
             
             if not self._cache_file.exists():
                 # Make it current locally
@@ -132,13 +173,13 @@ class S3PromptManager:
             # Also upload to S3 if enabled and not already there
             if self.config.use_s3:
                 try:
-                    existing_in_s3 = self._fetch_from_s3(f"{version}.txt")
+                    if not checked_s3:
+                        existing_in_s3 = self._fetch_from_s3(f"{version}.txt")
                     if not existing_in_s3:
                         print(f"  Syncing local prompt {version} to S3...")
-                        self._upload_to_s3(f"{version}.txt", local_content)
-                        self._upload_to_s3("current.txt", local_content)
-                        self._update_versions_manifest(version, None)
+                        self._upload_version(version, local_content, None, make_current=True)
                         print("  Synced to S3")
+                    self._mark_in_s3(version)
                 except Exception as e:
                     print(f"  Warning: Could not sync to S3: {e}")
             
@@ -175,16 +216,9 @@ class S3PromptManager:
         if self.config.use_s3:
             try:
                 print(f"  Uploading prompt {version} to S3...")
-                self._upload_to_s3(f"{version}.txt", content)
-                print(f"  ✓ Uploaded {version}.txt")
-                
-                if make_current:
-                    self._upload_to_s3("current.txt", content)
-                    print("  Uploaded current.txt")
-                    
-                    # Update versions.json in S3
-                    self._update_versions_manifest(version, note)
-                    print("  Updated versions.json")
+                for name in self._upload_version(version, content, note, make_current):
+                    print(f"  ✓ Uploaded {name}")
+                self._mark_in_s3(version)
             except Exception as e:
                 print(f"Warning: Could not upload prompt to S3: {e}")
                 self._queue_for_sync(version)
@@ -197,8 +231,10 @@ class S3PromptManager:
         """Get a specific version of the prompt."""
         # Check local first
         local_version = self.cache_dir / f"{version}.txt"
-        if local_version.exists():
-            return local_version.read_text()
+        try:
+            return local_version.read_bytes().decode("utf-8")
+        except FileNotFoundError:
+            pass
         
         # Try S3
         if self.config.use_s3:
@@ -210,135 +246,284 @@ class S3PromptManager:
         
         raise FileNotFoundError(f"Prompt version '{version}' not found")
     
-    def list_versions(self) -> list[dict]:
-        """List all available versions with metadata."""
-        versions = []
+    def list_versions(self, remote: bool = False) -> list[dict]:
+        """
+        List all available versions with metadata.
+        
+        Args:
+            remote: Also list versions stored in S3 (one paginated listing,
+                no per-object requests). Adds "remote", "size",
+                "last_modified" and "etag" to each entry.
+        
+        Returns:
+            Version entries sorted by version
+        """
+        versions = {}
         
         # Check local versions
         for f in self.cache_dir.glob("v*.txt"):
             version = f.stem
             meta_file = self.cache_dir / f"{version}_meta.json"
-            meta = {}
-            if meta_file.exists():
-                with open(meta_file) as mf:
-                    meta = json.load(mf)
+            try:
+                meta = loads(meta_file.read_bytes())
+            except FileNotFoundError:
+                meta = {}
             
-            versions.append({
+            versions[version] = {
                 "version": version,
                 "local": True,
                 "note": meta.get("note"),
                 "created_at": meta.get("created_at"),
-            })
-        
-        return sorted(versions, key=lambda x: x["version"])
+            }
+        
+        if remote and self.config.use_s3:
+            for version, obj in self._list_s3_versions().items():
+                entry = versions.setdefault(version, {
+                    "version": version,
+                    "local": False,
+                    "note": None,
+                    "created_at": obj["LastModified"].timestamp(),
+                })
+                entry.update({
+                    "remote": True,
+                    "size": obj["Size"],
+                    "last_modified": obj["LastModified"].timestamp(),
+                    "etag": obj["ETag"].strip('"'),
+                })
+            for entry in versions.values():
+                entry.setdefault("remote", False)
+        
+        return sorted(versions.values(), key=lambda x: x["version"])
     
     def _get_from_cache(self, ignore_ttl: bool = False) -> Optional[str]:
-        """Get prompt from local cache."""
-        if not self._cache_file.exists():
-            return None
+        """Get prompt from the in-memory cache, then the local cache file."""
+        entry = _memory_cache.get(self._cache_file)
+        if entry is not None:
+            content, cached_at = entry
+            if ignore_ttl or time.time() - cached_at <= self.config.prompt_cache_ttl_seconds:
+                return content
         
-        # Check TTL
-        if not ignore_ttl and self._cache_meta.exists():
-            with open(self._cache_meta) as f:
-                meta = json.load(f)
-            
+        # Read files directly (one open + read each) rather than stat-ing them first
+        cached_at = None
+        try:
+            meta = loads(self._cache_meta.read_bytes())
+        except FileNotFoundError:
+            pass
+        else:
+            # Check TTL
             cached_at = meta.get("cached_at", 0)
-            if time.time() - cached_at > self.config.prompt_cache_ttl_seconds:
+            if not ignore_ttl and time.time() - cached_at > self.config.prompt_cache_ttl_seconds:
                 return None  # Cache expired
         
-        return self._cache_file.read_text()
+        try:
+            content = self._cache_file.read_bytes().decode("utf-8")
+        except FileNotFoundError:
+            return None
+        if cached_at is not None:
+            _memory_cache[self._cache_file] = (content, cached_at)
+        return content
     
     def _save_to_cache(self, content: str) -> None:
         """Save prompt to local cache."""
-        self._cache_file.write_text(content)
+        cached_at = time.time()
+        atomic_write_bytes(self._cache_file, content.encode("utf-8"))
+        _memory_cache[self._cache_file] = (content, cached_at)
         
         # Save cache metadata
-        with open(self._cache_meta, "w") as f:
-            json.dump({
-                "cached_at": time.time(),
-                "content_hash": hashlib.md5(content.encode()).hexdigest(),
-            }, f)
+        atomic_write_bytes(self._cache_meta, dumps({
+            "cached_at": cached_at,
+            "content_hash": hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest(),
+        }))
     
     def _save_version_meta(self, version: str, note: str | None) -> None:
         """Save metadata for a version."""
         meta_file = self.cache_dir / f"{version}_meta.json"
-        with open(meta_file, "w") as f:
-            json.dump({
-                "version": version,
-                "note": note,
-                "created_at": time.time(),
-            }, f)
+        atomic_write_bytes(meta_file, dumps({
+            "version": version,
+            "note": note,
+            "created_at": time.time(),
+        }))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool for concurrent S3 requests."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=4)
+        return self._executor
     
+    def _upload_version(
+        self,
+        version: str,
+        content: str,
+        note: str | None,
+        make_current: bool,
+    ) -> list[str]:
+        """
+        Upload a version (and current.txt plus versions.json if it becomes current).
+        
+        The writes don't depend on each other, so they are issued concurrently.
+        
+        Returns:
+            Names of the uploaded files, in completion order
+        
+        Raises:
+            The first error raised by any of the uploads
+        """
+        executor = self._get_executor()
+        futures = {executor.submit(self._upload_to_s3, f"{version}.txt", content): f"{version}.txt"}
+        if make_current:
+            futures[executor.submit(self._upload_to_s3, "current.txt", content)] = "current.txt"
+            futures[executor.submit(self._update_versions_manifest, version, note)] = "versions.json"
+        
+        uploaded = []
+        for future in as_completed(futures):
+            future.result()
+            uploaded.append(futures[future])
+        return uploaded
+    
+    def _confirmed_in_s3(self, version: str) -> bool:
+        """Whether this process has already seen the version in S3."""
+        return (self.config.bucket, f"{self.config.prompts_prefix}{self.agent_id}/{version}") in _confirmed_in_s3
+
+    def _mark_in_s3(self, version: str) -> None:
+        _confirmed_in_s3.add((self.config.bucket, f"{self.config.prompts_prefix}{self.agent_id}/{version}"))
+
     def _fetch_from_s3(self, key: str) -> Optional[str]:
         """Fetch a prompt file from S3."""
-        import boto3
         from botocore.exceptions import ClientError
         
-        s3 = boto3.client("s3", region_name=self.config.region)
+        s3 = get_s3_client(self.config.region)
         s3_key = f"{self.config.prompts_prefix}{self.agent_id}/{key}"
         
         try:
             response = s3.get_object(Bucket=self.config.bucket, Key=s3_key)
-            return response["Body"].read().decode("utf-8")
+            body = response["Body"].read()
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchKey":
                 return None
             raise
+        
+        # Objects written with compress_prompts are zstd-encoded; older ones are plain
+        if response.get("ContentEncoding") == "zstd":
+            if not HAS_ZSTD:
+                raise RuntimeError(f"{s3_key} is zstd-compressed; install zstandard to read it")
+            body = zstandard.decompress(body)
+        return body.decode("utf-8")
     
     def _upload_to_s3(self, key: str, content: str) -> None:
         """Upload a prompt file to S3."""
-        import boto3
-        
-        s3 = boto3.client("s3", region_name=self.config.region)
+        s3 = get_s3_client(self.config.region)
         s3_key = f"{self.config.prompts_prefix}{self.agent_id}/{key}"
         
+        body = content.encode("utf-8")
+        extra = {}
+        if self.config.compress_prompts and HAS_ZSTD:
+            body = zstandard.compress(body, 3)
+            extra["ContentEncoding"] = "zstd"
+        
         s3.put_object(
             Bucket=self.config.bucket,
             Key=s3_key,
-            Body=content.encode("utf-8"),
+            Body=body,
             ContentType="text/plain",
+            **extra,
         )
     
+    def _copy_in_s3(self, src: str, dst: str, content: str) -> None:
+        """Copy a prompt file server-side, re-uploading `content` if the copy fails."""
+        s3 = get_s3_client(self.config.region)
+        prefix = f"{self.config.prompts_prefix}{self.agent_id}/"
+        
+        try:
+            # Metadata (ContentType, ContentEncoding) is copied along with the body
+            s3.copy_object(
+                Bucket=self.config.bucket,
+                Key=f"{prefix}{dst}",
+                CopySource={"Bucket": self.config.bucket, "Key": f"{prefix}{src}"},
+            )
+        except Exception:
+            self._upload_to_s3(dst, content)
+    
+    def _list_s3_versions(self) -> dict[str, dict]:
+        """List v*.txt objects under this agent's prefix, keyed by version."""
+        s3 = get_s3_client(self.config.region)
+        prefix = f"{self.config.prompts_prefix}{self.agent_id}/"
+        
+        found = {}
+        paginator = s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.config.bucket, Prefix=f"{prefix}v"):
+            for obj in page.get("Contents", []):
+                name = obj["Key"][len(prefix):]
+                if "/" not in name and name.endswith(".txt"):
+                    found[name[:-len(".txt")]] = obj
+        return found
+    
     def _update_versions_manifest(self, version: str, note: str | None) -> None:
-        """Update the versions manifest in S3."""
-        import boto3
+        """
+        Update the versions manifest in S3.
+        
+        After the first update the manifest and its ETag are kept in memory,
+        so later updates skip the GET and write with a conditional PUT. If
+        someone else changed the manifest in between, the PUT fails with 412
+        and the update is redone against a fresh copy.
+        """
         from botocore.exceptions import ClientError
         
-        s3 = boto3.client("s3", region_name=self.config.region)
+        s3 = get_s3_client(self.config.region)
         manifest_key = f"{self.config.prompts_prefix}{self.agent_id}/versions.json"
         
-        # Try to fetch existing manifest
-        manifest = {"versions": [], "current": version}
-        try:
-            response = s3.get_object(Bucket=self.config.bucket, Key=manifest_key)
-            manifest = json.loads(response["Body"].read().decode("utf-8"))
-        except ClientError:
-            pass
-        
-        # Add/update version
-        manifest["current"] = version
-        existing = next((v for v in manifest["versions"] if v["version"] == version), None)
-        if existing:
-            existing["note"] = note
-            existing["updated_at"] = time.time()
-        else:
-            manifest["versions"].append({
-                "version": version,
-                "note": note,
-                "created_at": time.time(),
-            })
-        
-        # Upload updated manifest
-        s3.put_object(
-            Bucket=self.config.bucket,
-            Key=manifest_key,
-            Body=json.dumps(manifest, indent=2),
-            ContentType="application/json",
-        )
+        for attempt in range(2):
+            if self._manifest_cache is not None and attempt == 0:
+                manifest, etag = self._manifest_cache
+            else:
+                # Fetch existing manifest
+                manifest, etag = {"versions": {}, "current": version}, None
+                try:
+                    response = s3.get_object(Bucket=self.config.bucket, Key=manifest_key)
+                    manifest = loads(decode_body(response))
+                    etag = response["ETag"]
+                except ClientError:
+                    pass
+            
+            # Older manifests stored versions as a list; key them by version
+            if isinstance(manifest["versions"], list):
+                manifest["versions"] = {v["version"]: v for v in manifest["versions"]}
+            
+            # Add/update version
+            manifest["current"] = version
+            existing = manifest["versions"].get(version)
+            if existing:
+                existing["note"] = note
+                existing["updated_at"] = time.time()
+            else:
+                manifest["versions"][version] = {
+                    "version": version,
+                    "note": note,
+                    "created_at": time.time(),
+                }
+            
+            # Upload updated manifest (only if it is still the copy we read)
+            body, put_kwargs = encode_body(dumps_pretty(manifest))
+            if etag:
+                put_kwargs["IfMatch"] = etag
+            self._manifest_cache = None
+            try:
+                response = s3.put_object(
+                    Bucket=self.config.bucket,
+                    Key=manifest_key,
+                    Body=body,
+                    ContentType="application/json",
+                    **put_kwargs,
+                )
+            except ClientError as e:
+                if attempt == 0 and e.response["Error"]["Code"] in ("PreconditionFailed", "ConditionalRequestConflict"):
+                    continue
+                raise
+            
+            self._manifest_cache = (manifest, response["ETag"])
+            return
     
     def _queue_for_sync(self, version: str) -> None:
         """Queue a version for later S3 sync."""
         sync_queue = self.config.local_dir / "prompt_sync_queue.txt"
         with open(sync_queue, "a") as f:
             f.write(f"{self.agent_id}:{version}\n")
-
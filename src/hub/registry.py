@@ -4,11 +4,18 @@ Agent Registry - Track all agents with metadata.
 Auto-registers agents on first run, stores in S3 for discovery.
 """
 
-import json
+import atexit
+import threading
 import time
 from typing import Optional
 
-from .config import get_config
+from ._storage import atomic_write_bytes, decode_body, encode_body
+from ._json import dumps_pretty, loads
+from .config import get_config, get_s3_client
+
+# record_run() batches registry writes: flush after this many runs or seconds
+FLUSH_MAX_RUNS = 32
+FLUSH_INTERVAL_SECONDS = 5.0
 
 
 class AgentRegistry:
@@ -27,10 +34,37 @@ class AgentRegistry:
         
         # List all agents
         agents = registry.list_agents()
+
+    AgentRegistry() returns one shared instance per process (per hub config),
+    so the registry is loaded at most once no matter how often it is created.
+
+    record_run() updates the in-memory registry right away but writes it
+    (locally and to S3) at most every FLUSH_INTERVAL_SECONDS or
+    FLUSH_MAX_RUNS runs. Pending runs are flushed at exit; call flush()
+    to write them sooner.
     """
-    
+
+    _instance: "AgentRegistry | None" = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._lock = threading.RLock()
+            cls._instance._pending_runs = 0
+            cls._instance._flush_timer = None
+            atexit.register(cls._instance.flush)
+        return cls._instance
+
     def __init__(self):
-        self.config = get_config()
+        config = get_config()
+        if getattr(self, "config", None) is config:
+            # Already initialized for the current hub config
+            return
+
+        # Write runs recorded under the previous config before switching
+        self.flush()
+
+        self.config = config
         self._local_registry = self.config.local_dir / "registry.json"
         self._cache: dict | None = None
     
@@ -70,6 +104,21 @@ class AgentRegistry:
             # Already registered, return existing
             return existing
 
+        updates = {
+            "description": description,
+            "tags": tags,
+            "system_prompt_key": system_prompt_key,
+            "repo_url": repo_url,
+            "owner": owner,
+            "environment": environment,
+            "model_id": model_id,
+        }
+        if existing and all(
+            existing.get(key) == value for key, value in updates.items() if value
+        ):
+            # Nothing changed, skip the write (and S3 upload)
+            return existing
+
         # Create or update entry
         entry = existing or {
             "agent_id": agent_id,
@@ -78,20 +127,9 @@ class AgentRegistry:
 
         entry["updated_at"] = time.time()
 
-        if description:
-            entry["description"] = description
-        if tags:
-            entry["tags"] = tags
-        if system_prompt_key:
-            entry["system_prompt_key"] = system_prompt_key
-        if repo_url:
-            entry["repo_url"] = repo_url
-        if owner:
-            entry["owner"] = owner
-        if environment:
-            entry["environment"] = environment
-        if model_id:
-            entry["model_id"] = model_id
+        for key, value in updates.items():
+            if value:
+                entry[key] = value
 
         # Set default prompt key if not specified
         if "system_prompt_key" not in entry:
@@ -148,25 +186,42 @@ class AgentRegistry:
         )
     
     def record_run(self, agent_id: str, run_id: str, success: bool) -> None:
-        """Record that an agent had a run."""
-        registry = self._load_registry()
-        
-        agent = registry["agents"].get(agent_id)
-        if not agent:
-            return
-        
-        # Update run stats
-        if "run_stats" not in agent:
-            agent["run_stats"] = {"total_runs": 0, "successful_runs": 0}
-        
-        agent["run_stats"]["total_runs"] += 1
-        if success:
-            agent["run_stats"]["successful_runs"] += 1
-        
-        agent["last_run_at"] = time.time()
-        agent["last_run_id"] = run_id
-        
-        self._save_registry(registry)
+        """Record that an agent had a run (written on the next flush)."""
+        with self._lock:
+            registry = self._load_registry()
+            
+            agent = registry["agents"].get(agent_id)
+            if not agent:
+                return
+            
+            # Update run stats
+            if "run_stats" not in agent:
+                agent["run_stats"] = {"total_runs": 0, "successful_runs": 0}
+            
+            agent["run_stats"]["total_runs"] += 1
+            if success:
+                agent["run_stats"]["successful_runs"] += 1
+            
+            agent["last_run_at"] = time.time()
+            agent["last_run_id"] = run_id
+            
+            self._pending_runs += 1
+            if self._pending_runs >= FLUSH_MAX_RUNS:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(FLUSH_INTERVAL_SECONDS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush(self) -> None:
+        """Write runs recorded since the last save."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            if self._pending_runs:
+                self._save_registry(self._cache)
     
     def _load_registry(self) -> dict:
         """Load registry from S3 or local cache."""
@@ -176,17 +231,16 @@ class AgentRegistry:
         # Try S3 first
         if self.config.use_s3:
             try:
-                import boto3
                 from botocore.exceptions import ClientError
                 
-                s3 = boto3.client("s3", region_name=self.config.region)
+                s3 = get_s3_client(self.config.region)
                 
                 try:
                     response = s3.get_object(
                         Bucket=self.config.bucket,
                         Key=self.config.registry_key,
                     )
-                    self._cache = json.loads(response["Body"].read().decode("utf-8"))
+                    self._cache = loads(decode_body(response))
                     
                     # Also save locally for offline access
                     self._save_local_registry(self._cache)
@@ -200,8 +254,7 @@ class AgentRegistry:
         
         # Try local
         if self._local_registry.exists():
-            with open(self._local_registry) as f:
-                self._cache = json.load(f)
+            self._cache = loads(self._local_registry.read_bytes())
             return self._cache
         
         # Initialize empty registry
@@ -210,32 +263,35 @@ class AgentRegistry:
     
     def _save_registry(self, registry: dict) -> None:
         """Save registry to S3 and local."""
-        registry["updated_at"] = time.time()
-        self._cache = registry
-        
-        # Save locally first
-        self._save_local_registry(registry)
-        
-        # Try S3
-        if self.config.use_s3:
-            try:
-                import boto3
-                
-                s3 = boto3.client("s3", region_name=self.config.region)
-                s3.put_object(
-                    Bucket=self.config.bucket,
-                    Key=self.config.registry_key,
-                    Body=json.dumps(registry, indent=2),
-                    ContentType="application/json",
-                )
-            except Exception as e:
-                print(f"Warning: Could not save registry to S3: {e}")
-                self._queue_for_sync()
+        with self._lock:
+            registry["updated_at"] = time.time()
+            self._cache = registry
+            # The whole registry is written, including any runs waiting for flush()
+            self._pending_runs = 0
+            
+            # Save locally first (serialized once for both copies)
+            data = dumps_pretty(registry)
+            atomic_write_bytes(self._local_registry, data)
+            
+            # Try S3
+            if self.config.use_s3:
+                try:
+                    s3 = get_s3_client(self.config.region)
+                    body, extra = encode_body(data)
+                    s3.put_object(
+                        Bucket=self.config.bucket,
+                        Key=self.config.registry_key,
+                        Body=body,
+                        ContentType="application/json",
+                        **extra,
+                    )
+                except Exception as e:
+                    print(f"Warning: Could not save registry to S3: {e}")
+                    self._queue_for_sync()
     
     def _save_local_registry(self, registry: dict) -> None:
         """Save registry to local file."""
-        with open(self._local_registry, "w") as f:
-            json.dump(registry, f, indent=2)
+        atomic_write_bytes(self._local_registry, dumps_pretty(registry))
     
     def _queue_for_sync(self) -> None:
         """Queue registry for later S3 sync."""
@@ -256,20 +312,18 @@ class AgentRegistry:
         
         registry = cls()
         try:
-            import boto3
-            
-            s3 = boto3.client("s3", region_name=config.region)
+            s3 = get_s3_client(config.region)
             
             # Load local and upload
             if registry._local_registry.exists():
-                with open(registry._local_registry) as f:
-                    data = json.load(f)
-                
+                # The local file is already the serialized registry
+                body, extra = encode_body(registry._local_registry.read_bytes())
                 s3.put_object(
                     Bucket=config.bucket,
                     Key=config.registry_key,
-                    Body=json.dumps(data, indent=2),
+                    Body=body,
                     ContentType="application/json",
+                    **extra,
                 )
                 
                 sync_pending.unlink()
@@ -8,6 +8,10 @@ from .models import (
     openai_model,
     writer_model,
     gemini_model,
+    shared_model,
+    invalidate_model_cache,
+    CachedModel,
+    build_model,
 )
 
 __all__ = [
@@ -17,4 +21,8 @@ __all__ = [
     "openai_model",
     "writer_model",
     "gemini_model",
+    "shared_model",
+    "invalidate_model_cache",
+    "CachedModel",
+    "build_model",
 ]
@@ -1,27 +1,167 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
 import os
-from dotenv import load_dotenv
-from strands.models.anthropic import AnthropicModel
-from strands.models.bedrock import BedrockModel
-from strands.models.openai import OpenAIModel
-from strands.models.ollama import OllamaModel
-from strands.models.writer import WriterModel
-from strands.models.gemini import GeminiModel
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Literal
+
+# Provider SDKs are imported inside each factory, so only the one you use is loaded
+if TYPE_CHECKING:
+    from strands.models.anthropic import AnthropicModel
+    from strands.models.bedrock import BedrockModel
+    from strands.models.openai import OpenAIModel
+    from strands.models.ollama import OllamaModel
+    from strands.models.writer import WriterModel
+    from strands.models.gemini import GeminiModel
+
+
+@functools.cache
+def _ensure_env_loaded() -> None:
+    """
+    Load .env once, on the first model created rather than at import.
+
+    Set STRANDS_SKIP_DOTENV=1 where the environment is injected (containers,
+    worker pools) to skip the .env search entirely.
+    """
+    if os.environ.get("STRANDS_SKIP_DOTENV"):
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+RESPONSE_CACHE_MAXSIZE = 2048
+RESPONSE_CACHE_TTL_SECONDS = 300.0
 
+# stream() kwargs that change the request; the rest (invocation_state,
+# model_state, cancel_signal, ...) is per-call agent state and differs every cycle
+_REQUEST_KWARGS = ("tool_choice", "system_prompt_content")
+
+
+class CachedModel:
+    """
+    Wrap a model so identical requests replay the previous response.
+
+    The key is a hash of the system prompt, tool specs and full message
+    history, so only exact repeats hit (e.g. the same one-shot prompt sent
+    by many requests). Hits skip the provider call entirely, including
+    the token cost. Entries expire after ttl seconds and the oldest are
+    evicted past maxsize. Only streams that complete are cached.
+
+    Everything else (config, structured_output, ...) goes to the wrapped
+    model.
+
+    Usage:
+        model = CachedModel(bedrock_model())
+        # or
+        model = bedrock_model(cache_responses=True)
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        maxsize: int = RESPONSE_CACHE_MAXSIZE,
+        ttl: float = RESPONSE_CACHE_TTL_SECONDS,
+    ):
+        self.model = model
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[float, list]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
+
+    @staticmethod
+    def _key(messages: Any, tool_specs: Any, system_prompt: Any, kwargs: dict) -> bytes:
+        request_kwargs = {k: kwargs[k] for k in _REQUEST_KWARGS if kwargs.get(k) is not None}
+        payload = json.dumps(
+            [system_prompt, tool_specs, messages, request_kwargs],
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+    def _get(self, key: bytes) -> list | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def _put(self, key: bytes, events: list) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, events)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    async def stream(
+        self,
+        messages: Any,
+        tool_specs: Any = None,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Any, None]:
+        """Replay a cached response, or stream from the model and cache it."""
+        key = self._key(messages, tool_specs, system_prompt, kwargs)
+        events = self._get(key)
+        if events is not None:
+            for event in events:
+                yield event
+            return
+
+        events = []
+        async for event in self.model.stream(messages, tool_specs, system_prompt, **kwargs):
+            events.append(event)
+            yield event
+        self._put(key, events)
+
+
+def _maybe_cached(model: Any, cache_responses: bool) -> Any:
+    return CachedModel(model) if cache_responses else model
 
-# Load environment variables
-load_dotenv()
 
 # ============================================================================
 # ANTHROPIC MODEL
 # https://docs.claude.com/en/docs/about-claude/models/overview#legacy-models
 # ============================================================================
 
-def anthropic_model(api_key: str = os.getenv("ANTHROPIC_API_KEY"),
+# Anthropic thinking configs (shared, treat as read-only)
+_THINKING_DISABLED = {"type": "disabled"}
+
+
+@functools.lru_cache(maxsize=16)
+def _thinking_enabled(budget_tokens: int) -> dict:
+    return {"type": "enabled", "budget_tokens": budget_tokens}
+
+
+def anthropic_model(api_key: str | None = None,
     model_id: str = "claude-haiku-4-5-20251001",
     max_tokens: int = 4000,
     temperature: float = 1,
     thinking: bool = True,
-    budget_tokens: int = 1024) -> AnthropicModel:
+    budget_tokens: int = 1024,
+    cache_responses: bool = False) -> AnthropicModel:
     """
     List of Anthropic models
     Args:
@@ -31,6 +171,7 @@ def anthropic_model(api_key: str = os.getenv("ANTHROPIC_API_KEY"),
         temperature: The temperature to use (default: 1)
         thinking: Whether to use thinking (default: False)
         budget_tokens: The budget tokens to use (default: 1000)
+        cache_responses: Replay responses to identical requests from memory, see CachedModel (default: False)
     Returns:
         AnthropicModel
 
@@ -41,19 +182,20 @@ def anthropic_model(api_key: str = os.getenv("ANTHROPIC_API_KEY"),
     - claude-3-7-sonnet-20250219 - 200k context - 64k max_output tokens - input $3/M - output $15/M - Reasoning yes
     - claude-3-5-haiku-20241022 - 200k context - 8k max_output tokens - input $0.80/M - output $4/M - Reasoning no
     """
+    from strands.models.anthropic import AnthropicModel
+
+    _ensure_env_loaded()
+    if api_key is None:
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+
     if thinking:
         if budget_tokens >= max_tokens:
             raise ValueError("Budget tokens cannot be greater than max tokens")
-        thinking = {
-            "type": "enabled",
-            "budget_tokens": budget_tokens
-        }
+        thinking = _thinking_enabled(budget_tokens)
     else:
-        thinking = {
-            "type": "disabled",
-        }
+        thinking = _THINKING_DISABLED
 
-    return AnthropicModel(
+    model = AnthropicModel(
         client_args={
             "api_key": api_key,
         },
@@ -64,17 +206,19 @@ def anthropic_model(api_key: str = os.getenv("ANTHROPIC_API_KEY"),
             "thinking": thinking
         }
     )
+    return _maybe_cached(model, cache_responses)
 
 # ============================================================================
 # OPENAI MODEL
 # https://platform.openai.com/docs/models
 # ============================================================================
 
-def openai_model(api_key: str = os.getenv("OPENAI_API_KEY"),
+def openai_model(api_key: str | None = None,
     model_id: str = "gpt-5-mini-2025-08-07",
     max_tokens: int = 16000,
     temperature: float = 1,
-    reasoning_effort: str = "medium") -> OpenAIModel:
+    reasoning_effort: str = "medium",
+    cache_responses: bool = False) -> OpenAIModel:
     """
     List of OpenAI models
     Args:
@@ -83,6 +227,7 @@ def openai_model(api_key: str = os.getenv("OPENAI_API_KEY"),
         max_tokens: The maximum number of tokens to generate (default: 16000 max: 16000)
         temperature: The temperature to use (default: 1)
         reasoning_effort: The reasoning effort to use (default: "low")
+        cache_responses: Replay responses to identical requests from memory, see CachedModel (default: False)
     Returns:
         OpenAIModel
 
@@ -96,7 +241,13 @@ def openai_model(api_key: str = os.getenv("OPENAI_API_KEY"),
     - gpt-5-pro-2025-10-06 - 400k context - 272K max_output tokens - input $1.25/M - output $120/M - Reasoning yes - slower
     - o4-mini-deep-research-2025-06-26 - 200k context - 100k max_output tokens - input $2/M - output $8/M - Reasoning yes
     """
-    return OpenAIModel(
+    from strands.models.openai import OpenAIModel
+
+    _ensure_env_loaded()
+    if api_key is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+
+    model = OpenAIModel(
         client_args={
             "api_key": api_key,
         },
@@ -107,6 +258,7 @@ def openai_model(api_key: str = os.getenv("OPENAI_API_KEY"),
             "reasoning_effort": reasoning_effort,
         }
     )
+    return _maybe_cached(model, cache_responses)
 
 
 # ============================================================================
@@ -114,10 +266,26 @@ def openai_model(api_key: str = os.getenv("OPENAI_API_KEY"),
 # https://ollama.com/library
 # ============================================================================
 
-def ollama_model(host: str = os.getenv("OLLAMA_HOST"),
+# Supported Ollama models and the max_tokens each is run with
+_OLLAMA_MAX_TOKENS = {
+    "qwen3:4b": 128000,
+    "llama3.1:latest": 128000,
+    "gemma3n:e4b": 8000,
+}
+_OLLAMA_NO_TOOLS = frozenset({"gemma3n:e4b"})
+
+
+@functools.cache
+def _warn_no_tools(model_id: str) -> None:
+    """Warn once per process that a model can't call tools."""
+    warnings.warn(f"Tools are not supported with {model_id}.", stacklevel=3)
+
+
+def ollama_model(host: str | None = None,
     model_id: str = "qwen3:4b",
     max_tokens: int = 2000,
     temperature: float = 1,
+    cache_responses: bool = False,
     ) -> OllamaModel:
     """
     List of Ollama models
@@ -126,6 +294,7 @@ def ollama_model(host: str = os.getenv("OLLAMA_HOST"),
         model_id: The model ID to use (default: qwen3:4b)
         max_tokens: The maximum number of tokens to generate (default: 2000 max: 128000)
         temperature: The temperature to use (default: 1)
+        cache_responses: Replay responses to identical requests from memory, see CachedModel (default: False)
     Returns:
         OllamaModel
 
@@ -135,33 +304,36 @@ def ollama_model(host: str = os.getenv("OLLAMA_HOST"),
     - gemma3n:e4b (does not support tools) - 32k context - 8K max_output tokens
     - nomic-embed-text:latest (embedding model) - 2k context
     """
-    if model_id == "qwen3:4b":
-        max_tokens = 128000
-    elif model_id == "llama3.1:latest":
-        max_tokens = 128000
-    elif model_id == "gemma3n:e4b":
-        max_tokens = 8000
-    else:
+    from strands.models.ollama import OllamaModel
+
+    _ensure_env_loaded()
+    if host is None:
+        host = os.getenv("OLLAMA_HOST")
+
+    max_tokens = _OLLAMA_MAX_TOKENS.get(model_id)
+    if max_tokens is None:
         raise ValueError(f"Model ID {model_id} not supported")
 
-    if model_id == "gemma3n:e4b":
-        print("NOTE: Tools are not supported with model.")
-    return OllamaModel(
+    if model_id in _OLLAMA_NO_TOOLS:
+        _warn_no_tools(model_id)
+    model = OllamaModel(
         host=host,
         model_id=model_id,
         max_tokens=max_tokens,
         temperature=temperature,
     )
+    return _maybe_cached(model, cache_responses)
 
 
 # ============================================================================
 # WRITER MODEL
 # https://writer.com/library
 # ============================================================================
-def writer_model(api_key: str = os.getenv("WRITER_API_KEY"),
+def writer_model(api_key: str | None = None,
     model_id: str = "palmyra-x5",
     max_tokens: int = 2000,
     temperature: float = 1,
+    cache_responses: bool = False,
 ) -> WriterModel:
     """
     List of Writer models
@@ -170,6 +342,7 @@ def writer_model(api_key: str = os.getenv("WRITER_API_KEY"),
         model_id: The model ID to use (default: palmyra-x5)
         max_tokens: The maximum number of tokens to generate (default: 2000 max: 2000)
         temperature: The temperature to use (default: 1)
+        cache_responses: Replay responses to identical requests from memory, see CachedModel (default: False)
     Returns:
         WriterModel
 
@@ -180,19 +353,26 @@ def writer_model(api_key: str = os.getenv("WRITER_API_KEY"),
     - palmyra-med - 32k context - 8k max_output tokens - input $5/M - output $12/M
     - palmyra-creative - 128k context - 32k max_output tokens - input $5/M - output $12/M
     """
-    return WriterModel(
+    from strands.models.writer import WriterModel
+
+    _ensure_env_loaded()
+    if api_key is None:
+        api_key = os.getenv("WRITER_API_KEY")
+
+    model = WriterModel(
         client_args={"api_key": api_key},
         model_id=model_id,
         max_tokens=max_tokens,
         temperature=temperature,
     )
+    return _maybe_cached(model, cache_responses)
 
 
 # ============================================================================
 # GEMINI MODEL
 # https://ai.google.dev/gemini-api/docs/models
 # ============================================================================
-def gemini_model(api_key: str = os.getenv("GOOGLE_API_KEY"),
+def gemini_model(api_key: str | None = None,
     model_id: str = "gemini-3-flash-preview",
     max_tokens: int = 8192,
     temperature: float = 1,
@@ -200,6 +380,9 @@ def gemini_model(api_key: str = os.getenv("GOOGLE_API_KEY"),
     top_k: int = 40,
     thinking: bool = False,
     budget_tokens: int = 1024,
+    http_options: dict | None = None,
+    cached_content: str | None = None,
+    cache_responses: bool = False,
     **kwargs) -> GeminiModel:
     """
     List of Gemini models
@@ -212,6 +395,11 @@ def gemini_model(api_key: str = os.getenv("GOOGLE_API_KEY"),
         top_k: The top_k to use (default: 40)
         thinking: Whether to enable thinking/reasoning mode (default: False)
         budget_tokens: The budget for thinking tokens (default: 1024)
+        http_options: google-genai HttpOptions for the model's client, e.g.
+            {"async_client_args": {"http2": True}} (default: None)
+        cached_content: Name of a context cache created with the genai caches API
+            (e.g. "cachedContents/abc123") to reuse a long shared prefix (default: None)
+        cache_responses: Replay responses to identical requests from memory, see CachedModel (default: False)
         **kwargs: Additional model parameters (e.g. aspect_ratio for image gen)
     Returns:
         GeminiModel
@@ -227,6 +415,12 @@ def gemini_model(api_key: str = os.getenv("GOOGLE_API_KEY"),
     Grounding with Google Search billing starts Jan 5, 2026.
     Context Caching for Flash: $0.05/M processing + $1.00/M/hour storage.
     """
+    from strands.models.gemini import GeminiModel
+
+    _ensure_env_loaded()
+    if api_key is None:
+        api_key = os.getenv("GOOGLE_API_KEY")
+
     params = {
         "max_output_tokens": max_tokens,
         "temperature": temperature,
@@ -235,27 +429,41 @@ def gemini_model(api_key: str = os.getenv("GOOGLE_API_KEY"),
         **kwargs
     }
 
+    if cached_content:
+        params["cached_content"] = cached_content
+
     if thinking:
         params["thinking_config"] = {"include_thoughts": True}
         if budget_tokens:
             params["max_output_tokens"] = max_tokens + budget_tokens
 
-    return GeminiModel(
-        client_args={
-            "api_key": api_key,
-        },
+    client_args = {"api_key": api_key}
+    if http_options:
+        client_args["http_options"] = http_options
+
+    model = GeminiModel(
+        client_args=client_args,
         model_id=model_id,
         params=params
     )
+    return _maybe_cached(model, cache_responses)
 
 
 # ============================================================================
 # AMAZON BEDROCK MODEL
 # https://docs.aws.amazon.com/bedrock/latest/userguide/models-supported.html
 # ============================================================================
+
+# Bedrock Anthropic model IDs, bare or behind a cross-region inference profile
+_BEDROCK_ANTHROPIC_PREFIXES = tuple(
+    f"{geo}anthropic."
+    for geo in ("", "us.", "eu.", "apac.", "jp.", "au.", "ca.", "us-gov.", "global.")
+)
+
+
 def bedrock_model(
     model_id: str = "us.anthropic.claude-sonnet-4-5-20250929-v1:0",
-    region_name: str = os.getenv("AWS_REGION", "us-east-1"),
+    region_name: str | None = None,
     max_tokens: int = 4096,
     temperature: float = 1.0,
     top_p: float = 0.9,
@@ -263,6 +471,8 @@ def bedrock_model(
     thinking: bool = False,
     budget_tokens: int = 10000,
     extended_context: bool = False,
+    prompt_caching: bool = False,
+    cache_responses: bool = False,
 ) -> BedrockModel:
     """
     Create an Amazon Bedrock model with support for multiple providers.
@@ -277,6 +487,9 @@ def bedrock_model(
         thinking: Enable extended thinking for Anthropic models (default: False)
         budget_tokens: Token budget for thinking when enabled (default: 10000)
         extended_context: Enable 1M context beta for supported Anthropic models (default: False)
+        prompt_caching: Add cache points after the system prompt and tool specs, so
+            repeat requests in an agent loop reuse the cached prefix (default: False)
+        cache_responses: Replay responses to identical requests from memory, see CachedModel (default: False)
 
     Returns:
         BedrockModel
@@ -320,8 +533,20 @@ def bedrock_model(
     - IAM role (if running on AWS)
 
     Extended thinking and 1M context are only supported on Anthropic models.
+    Prompt caching is supported on Claude 3.5 Haiku / 3.7 Sonnet and newer and on Nova.
     """
-    is_anthropic = "anthropic" in model_id.lower()
+    from strands.models.bedrock import BedrockModel
+
+    # Also makes AWS credentials from .env visible to boto3
+    _ensure_env_loaded()
+    if region_name is None:
+        region_name = os.getenv("AWS_REGION", "us-east-1")
+
+    if model_id.startswith("arn:"):
+        # Inference profile / provisioned model ARNs: the provider is somewhere in the path
+        is_anthropic = "anthropic" in model_id.lower()
+    else:
+        is_anthropic = model_id.startswith(_BEDROCK_ANTHROPIC_PREFIXES)
 
     additional_params = {
         "temperature": temperature,
@@ -346,10 +571,107 @@ def bedrock_model(
     if extended_context and is_anthropic:
         additional_headers["anthropic-beta"] = "extended-context-1m-2025-04-14"
 
-    return BedrockModel(
+    # Prompt caching: cache points after the (static) system prompt and tool specs
+    cache_config = {}
+    if prompt_caching:
+        cache_config = {"cache_prompt": "default", "cache_tools": "default"}
+
+    model = BedrockModel(
         model_id=model_id,
         region_name=region_name,
         max_tokens=max_tokens,
         additional_request_fields=additional_params if additional_params else None,
         additional_headers=additional_headers if additional_headers else None,
-    )
\ No newline at end of file
+        **cache_config,
+    )
+    return _maybe_cached(model, cache_responses)
+
+# ============================================================================
+# SHARED MODEL INSTANCES
+# ============================================================================
+
+_model_cache: dict[tuple, Any] = {}
+_model_cache_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Make a factory argument hashable (lists -> tuples, dicts -> sorted item tuples)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def shared_model(factory: Callable[..., Any], **kwargs: Any) -> Any:
+    """
+    Get one model instance per (factory, arguments), creating it on first use.
+
+    Every factory call builds a new provider client (HTTP connection pool,
+    TLS setup, boto3 client for Bedrock). Code that creates an agent per
+    request can share the model instead, so connections are reused.
+    The instance is shared: don't call update_config() on it.
+
+    Args:
+        factory: One of the *_model factories in this module
+        **kwargs: Arguments passed to the factory
+
+    Returns:
+        The cached model instance
+
+    Usage:
+        model = shared_model(bedrock_model, model_id="us.amazon.nova-lite-v1:0")
+    """
+    key = (factory.__name__, _freeze(kwargs))
+    with _model_cache_lock:
+        model = _model_cache.get(key)
+        if model is None:
+            model = _model_cache[key] = factory(**kwargs)
+    return model
+
+
+def invalidate_model_cache() -> None:
+    """Drop shared model instances (e.g. after rotating API keys)."""
+    with _model_cache_lock:
+        _model_cache.clear()
+
+
+# ============================================================================
+# PROVIDER DISPATCH
+# ============================================================================
+
+Provider = Literal["anthropic", "openai", "bedrock", "gemini", "writer", "ollama"]
+
+_PROVIDERS: dict[str, Callable[..., Any]] = {
+    "anthropic": anthropic_model,
+    "openai": openai_model,
+    "bedrock": bedrock_model,
+    "gemini": gemini_model,
+    "writer": writer_model,
+    "ollama": ollama_model,
+}
+
+
+def build_model(provider: Provider, shared: bool = False, **kwargs: Any) -> Any:
+    """
+    Create a model by provider name, e.g. from a router decision or config file.
+
+    Args:
+        provider: One of "anthropic", "openai", "bedrock", "gemini", "writer", "ollama"
+        shared: Return the instance cached by shared_model() instead of a new one (default: False)
+        **kwargs: Arguments passed to the provider's factory
+
+    Returns:
+        The provider's model instance
+
+    Usage:
+        model = build_model("bedrock", model_id="us.amazon.nova-lite-v1:0")
+        model = build_model(route.provider, shared=True, model_id=route.model_id)
+    """
+    factory = _PROVIDERS.get(provider)
+    if factory is None:
+        raise ValueError(f"Unknown provider {provider!r}, expected one of: {', '.join(_PROVIDERS)}")
+
+    if shared:
+        return shared_model(factory, **kwargs)
+    return factory(**kwargs)
@@ -1,67 +1,51 @@
-"""Agent tools for model selection, recommendations, and media generation."""
+"""Agent tools for model selection, recommendations, and media generation.
 
-from .model_selector import (
-    get_available_models,
-    get_model_recommendation,
-    compare_models
-)
+Tools are imported on first access, so importing one tool module (or this
+package) doesn't load every tool's SDK (google-genai, Pillow, Playwright).
+"""
 
-from .code_reader import (
-    grab_code,
-)
+from importlib import import_module
 
-from .gemini_image import (
-    generate_image,
-    edit_image,
-)
-
-from .gemini_video import (
-    generate_video,
-    generate_video_from_image,
-)
-
-from .gemini_music import (
-    generate_music,
-    generate_music_weighted,
-)
-
-from .carbon_image import (
-    generate_code_image,
-    generate_code_image_from_file,
-    list_carbon_themes,
-)
-
-from .ffmpeg_video import (
-    cut_video,
-    concat_videos,
-    get_video_info,
-    extract_audio,
-)
-
-__all__ = [
+# Exported tool name -> submodule that defines it
+_TOOL_MODULES = {
     # Model selector tools
-    "get_available_models",
-    "get_model_recommendation",
-    "compare_models",
+    "get_available_models": "model_selector",
+    "get_model_recommendation": "model_selector",
+    "compare_models": "model_selector",
     # Code reader tools
-    "grab_code",
+    "grab_code": "code_reader",
     # Carbon image tools
-    "generate_code_image",
-    "generate_code_image_from_file",
-    "list_carbon_themes",
+    "generate_code_image": "carbon_image",
+    "generate_code_image_from_file": "carbon_image",
+    "list_carbon_themes": "carbon_image",
     # Gemini image tools
-    "generate_image",
-    "edit_image",
+    "generate_image": "gemini_image",
+    "edit_image": "gemini_image",
     # Gemini video tools
-    "generate_video",
-    "generate_video_from_image",
+    "generate_video": "gemini_video",
+    "generate_video_from_image": "gemini_video",
     # Gemini music tools
-    "generate_music",
-    "generate_music_weighted",
+    "generate_music": "gemini_music",
+    "generate_music_weighted": "gemini_music",
     # FFmpeg video tools
-    "cut_video",
-    "concat_videos",
-    "get_video_info",
-    "extract_audio",
-]
+    "cut_video": "ffmpeg_video",
+    "concat_videos": "ffmpeg_video",
+    "get_video_info": "ffmpeg_video",
+    "extract_audio": "ffmpeg_video",
+}
+
+__all__ = list(_TOOL_MODULES)
+
+
+def __getattr__(name: str):
+    module = _TOOL_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
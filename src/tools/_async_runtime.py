@@ -0,0 +1,72 @@
+"""
+Async Runtime - A long-lived event loop for async work inside sync tools.
+
+Strands runs sync tools on worker threads, and each agent call starts a new
+event loop. Playwright objects are bound to the loop that created them, so
+per-call loops would restart the browser transport every turn. Tools submit
+coroutines here instead; they all run on one daemon-thread loop that lives
+for the whole process.
+
+Usage:
+    from ._async_runtime import run_async
+    result = run_async(capture_screenshot(...))
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional
+
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_THREAD: Optional[threading.Thread] = None
+_LOCK = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Get the runtime loop, starting its thread on first use."""
+    global _LOOP, _THREAD
+    with _LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            _THREAD = threading.Thread(
+                target=_LOOP.run_forever,
+                name="tools-async-runtime",
+                daemon=True,
+            )
+            _THREAD.start()
+        return _LOOP
+
+
+def run_async(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the runtime loop and block until it finishes."""
+    loop = get_loop()
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_async() cannot be called from the runtime loop itself")
+
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+
+def shutdown(timeout: float = 10.0) -> None:
+    """Close the shared browser pool and stop the runtime loop. Safe to call more than once."""
+    global _LOOP, _THREAD
+    with _LOCK:
+        loop, thread = _LOOP, _THREAD
+        _LOOP, _THREAD = None, None
+
+    if loop is None:
+        return
+
+    from . import _browser_pool
+
+    _browser_pool.shutdown()
+
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout)
+    if not loop.is_running():
+        loop.close()
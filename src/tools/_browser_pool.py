@@ -0,0 +1,330 @@
+"""
+Browser Pool - Shared Playwright Chromium instances for rendering tools.
+
+Cold-starting Chromium dominates the wall time of a single screenshot, so
+rendering tools check out a BrowserContext from a long-lived pool instead of
+launching a browser per call. Browsers are relaunched after serving a
+configurable number of contexts to bound native memory growth.
+
+By default each browser runs on a persistent profile directory so the
+font, shader, V8 code and HTTP caches survive across renders and process
+restarts. Each profile is held under an exclusive lock. Concurrent
+browsers, including those in other processes, fall back to numbered
+siblings (carbon-profile-2, carbon-profile-3, ...).
+
+Environment Variables:
+    BROWSER_POOL_SIZE: Number of Chromium instances to keep warm (default: 2)
+    BROWSER_POOL_RECYCLE_AFTER: Contexts served before a browser is relaunched (default: 100)
+    BROWSER_POOL_PERSISTENT: Use persistent profiles instead of incognito contexts (default: true)
+    BROWSER_POOL_PROFILE_DIR: Base profile directory (default: ~/.cache/strands/carbon-profile)
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: profiles are only deduplicated within this process
+    fcntl = None
+
+_DEFAULT_PROFILE_DIR = Path.home() / ".cache" / "strands" / "carbon-profile"
+_MAX_PROFILES = 32
+
+# Flags for offscreen, screenshot-only workloads (shared by every Playwright tool)
+_CHROMIUM_PERF_ARGS = [
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI,BlinkGenPropertyTrees",
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--no-first-run",
+    "--no-zygote",
+    "--mute-audio",
+    "--hide-scrollbars",
+]
+
+# Extra flags for persistent profiles: cap the on-disk HTTP cache at 100MB
+_PERSISTENT_PROFILE_ARGS = _CHROMIUM_PERF_ARGS + [
+    "--disk-cache-size=104857600",
+]
+
+
+@dataclass
+class _Slot:
+    """A launched browser (or persistent-profile context) and its usage counters."""
+
+    browser: Any = None
+    context: Any = None
+    profile: Optional[Path] = None
+    profile_lock: Any = None
+    served: int = 0
+    active: int = 0
+    alive: bool = True
+
+
+def _lock_profile(profile: Path):
+    """Take an exclusive, non-blocking lock on a profile directory. Returns the lock file or None."""
+    profile.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        return True
+
+    lock_file = open(profile / ".lock", "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def _unlock_profile(lock_file) -> None:
+    if lock_file is None or lock_file is True:
+        return
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+    finally:
+        lock_file.close()
+
+
+class BrowserPool:
+    """
+    Pool of warm Chromium browsers handing out BrowserContexts.
+
+    Incognito browsers hand out a fresh context per acquire. Persistent
+    profiles share their single context, so callers should close the pages
+    they open rather than rely on release() to discard them.
+
+    Usage:
+        pool = get_pool()
+        context = await pool.acquire()
+        try:
+            page = await context.new_page()
+            ...
+            await page.close()
+        finally:
+            await pool.release(context)
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        recycle_after: Optional[int] = None,
+        headless: bool = True,
+        persistent: Optional[bool] = None,
+        profile_dir: Optional[str] = None,
+    ):
+        self.size = max(1, size or int(os.getenv("BROWSER_POOL_SIZE", "2")))
+        self.recycle_after = max(1, recycle_after or int(os.getenv("BROWSER_POOL_RECYCLE_AFTER", "100")))
+        self.headless = headless
+        if persistent is None:
+            persistent = os.getenv("BROWSER_POOL_PERSISTENT", "true").lower() == "true"
+        self.persistent = persistent
+        self.profile_dir = Path(
+            profile_dir or os.getenv("BROWSER_POOL_PROFILE_DIR") or _DEFAULT_PROFILE_DIR
+        ).expanduser()
+
+        self._playwright = None
+        self._slots: list[_Slot] = []
+        self._owners: dict[int, _Slot] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def acquire(self):
+        """Check out a BrowserContext from a warm browser."""
+        await self._ensure_started()
+
+        async with self._lock:
+            slot = await self._pick_slot()
+            if slot.context is not None:
+                # Persistent profiles share their single context; callers only open pages
+                context = slot.context
+            else:
+                context = await slot.browser.new_context()
+                self._owners[id(context)] = slot
+            slot.served += 1
+            slot.active += 1
+
+        return context
+
+    async def release(self, context) -> None:
+        """Return a context and relaunch its browser once it has served enough contexts."""
+        slot = next((s for s in self._slots if s.context is context), None)
+        if slot is None:
+            slot = self._owners.pop(id(context), None)
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+        if slot is None:
+            return
+
+        slot.active -= 1
+        if slot.served >= self.recycle_after and slot.active == 0:
+            async with self._lock:
+                if slot in self._slots:
+                    self._slots.remove(slot)
+                    await self._close_slot(slot)
+
+    async def close(self) -> None:
+        """Close all browsers and stop Playwright."""
+        for slot in self._slots:
+            await self._close_slot(slot)
+        self._slots = []
+        self._owners = {}
+
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    async def _ensure_started(self) -> None:
+        """Start Playwright on the running loop (objects are bound to the loop that created them)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._abandon_loop()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+
+    async def _pick_slot(self) -> _Slot:
+        """Pick an idle browser, launching one if the pool is not yet full."""
+        for slot in self._slots:
+            if not slot.alive:
+                _unlock_profile(slot.profile_lock)
+                slot.profile_lock = None
+        self._slots = [s for s in self._slots if s.alive]
+        live = [s for s in self._slots if s.served < self.recycle_after]
+
+        idle = [s for s in live if s.active == 0]
+        if idle:
+            return idle[0]
+
+        if len(live) < self.size:
+            slot = await (self._launch_persistent() if self.persistent else self._launch())
+            self._slots.append(slot)
+            return slot
+
+        return min(live, key=lambda s: s.active)
+
+    async def _launch(self) -> _Slot:
+        browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=_CHROMIUM_PERF_ARGS,
+        )
+        slot = _Slot(browser=browser)
+        browser.on("disconnected", lambda _: setattr(slot, "alive", False))
+        return slot
+
+    async def _launch_persistent(self) -> _Slot:
+        """Launch Chromium on the first profile directory not locked by another browser."""
+        in_use = {s.profile for s in self._slots}
+
+        for n in range(1, _MAX_PROFILES + 1):
+            profile = self.profile_dir if n == 1 else self.profile_dir.with_name(f"{self.profile_dir.name}-{n}")
+            if profile in in_use:
+                continue
+
+            lock = _lock_profile(profile)
+            if lock is None:
+                continue
+
+            try:
+                context = await self._playwright.chromium.launch_persistent_context(
+                    user_data_dir=str(profile),
+                    headless=self.headless,
+                    args=_PERSISTENT_PROFILE_ARGS,
+                )
+            except Exception:
+                _unlock_profile(lock)
+                raise
+
+            slot = _Slot(context=context, profile=profile, profile_lock=lock)
+            context.on("close", lambda _: setattr(slot, "alive", False))
+            return slot
+
+        raise RuntimeError(f"No free browser profile under {self.profile_dir.parent} ({_MAX_PROFILES} in use)")
+
+    def _abandon_loop(self) -> None:
+        """Drop browsers started on a previous event loop (they cannot be driven from this one)."""
+        for slot in self._slots:
+            _unlock_profile(slot.profile_lock)
+        self._playwright = None
+        self._slots = []
+        self._owners = {}
+
+    @staticmethod
+    async def _close_slot(slot: _Slot) -> None:
+        try:
+            if slot.context is not None:
+                await slot.context.close()
+            else:
+                await slot.browser.close()
+        except Exception:
+            pass
+        finally:
+            _unlock_profile(slot.profile_lock)
+            slot.profile_lock = None
+
+
+# Global pool instance (created on first use)
+_pool: Optional[BrowserPool] = None
+
+
+def get_pool() -> BrowserPool:
+    """Get or create the global browser pool."""
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool()
+    return _pool
+
+
+async def get_context():
+    """Check out a BrowserContext from the global pool."""
+    return await get_pool().acquire()
+
+
+async def release(context) -> None:
+    """Return a BrowserContext to the global pool."""
+    await get_pool().release(context)
+
+
+def shutdown() -> None:
+    """Close the global pool. Safe to register with atexit."""
+    pool = _pool
+    if pool is None or pool._loop is None:
+        return
+
+    loop = pool._loop
+    if loop.is_closed():
+        return
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        return
+
+    try:
+        if loop.is_running():
+            # Loop is driven by another thread (see _async_runtime)
+            asyncio.run_coroutine_threadsafe(pool.close(), loop).result(timeout=10)
+        else:
+            loop.run_until_complete(pool.close())
+    except Exception:
+        pass
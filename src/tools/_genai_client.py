@@ -0,0 +1,74 @@
+"""
+Gemini Client - Shared google-genai clients for the Gemini tools.
+
+A genai.Client owns an HTTP connection pool. Creating one per tool call
+throws that pool away, so every call pays a fresh TLS handshake. Tools
+fetch a client from here instead, which keeps one client per
+(api_key, api_version) for the life of the process.
+
+Only the synchronous clients are shared. Strands runs every agent call
+on a fresh event loop, and an async HTTP client is bound to the loop
+that opened its connections, so a process-wide async client would fail
+on the second turn.
+"""
+
+import atexit
+import threading
+from typing import Optional
+
+from google import genai
+
+_clients: dict[tuple[str, Optional[str]], genai.Client] = {}
+_lock = threading.Lock()
+
+
+def get_client(api_key: str, api_version: Optional[str] = None) -> genai.Client:
+    """Get (or create) the shared client for an API key and version."""
+    key = (api_key, api_version)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            if api_version:
+                client = genai.Client(api_key=api_key, http_options={"api_version": api_version})
+            else:
+                client = genai.Client(api_key=api_key)
+            _clients[key] = client
+        return client
+
+
+def preconnect(api_key: str, api_version: Optional[str] = None) -> None:
+    """
+    Open the shared client's connection in the background.
+
+    Issues a cheap models.list() on a daemon thread so the DNS lookup and
+    TLS handshake overlap with whatever the caller does next (typically
+    waiting for the first prompt). Failures are ignored; the first real
+    call will surface them.
+    """
+    if not api_key:
+        return
+
+    def _warm() -> None:
+        try:
+            get_client(api_key, api_version).models.list(config={"page_size": 1})
+        except Exception:
+            pass
+
+    threading.Thread(target=_warm, name="genai-preconnect", daemon=True).start()
+
+
+@atexit.register
+def close_clients() -> None:
+    """Close pooled connections held by the shared clients."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+
+    for client in clients:
+        close = getattr(client, "close", None)
+        if close is None:
+            continue
+        try:
+            close()
+        except Exception:
+            pass
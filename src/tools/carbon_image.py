@@ -4,6 +4,12 @@ Carbon Code Image Generation Tool
 Generate beautiful code screenshots using Carbon (carbon.now.sh)
 with Playwright for browser automation.
 
+Themes with a highlight.js equivalent are rendered from a local
+Carbon-style shell (assets/carbon_shell.html) instead of loading the
+hosted Carbon app; pass online=True to always use carbon.now.sh.
+With fidelity="fast", themes with a Pygments equivalent skip the browser
+entirely and are drawn with Pygments + Pillow (no window chrome).
+
 Features:
 - Multiple syntax themes
 - Customizable backgrounds
@@ -14,13 +20,43 @@ For cloud deployment, see carbon_image_cloud.py which uses AgentCore Browser.
 """
 
 import asyncio
+import base64
+import hashlib
+import io
+import itertools
+import os
+import re
+import shutil
 import urllib.parse
 from pathlib import Path
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Literal, Optional, get_args
 
 from strands import tool
 
+if __package__:
+    from ._async_runtime import run_async
+    from ._browser_pool import get_pool
+else:
+    # Loaded as a standalone file by Agent(load_tools_from_directory=True)
+    from tools._async_runtime import run_async
+    from tools._browser_pool import get_pool
+
+try:
+    from pygments import highlight
+    from pygments.formatters import ImageFormatter
+    from pygments.lexers import get_lexer_by_name, guess_lexer
+    from pygments.util import ClassNotFound
+    HAS_PYGMENTS = True
+except ImportError:
+    HAS_PYGMENTS = False
+
+try:
+    from PIL import Image, ImageColor
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
 # Carbon configuration types
 Theme = Literal[
     "3024-night", "a11y-dark", "blackboard", "base16-dark", "base16-light",
@@ -31,8 +67,116 @@ Theme = Literal[
     "yeti", "zenburn"
 ]
 
+# Static theme catalog served by list_carbon_themes (built once at import)
+_THEMES = get_args(Theme)
+_RECOMMENDED_THEMES = {
+    "dark_professional": ("seti", "vscode", "one-dark", "material"),
+    "dark_vibrant": ("dracula", "synthwave-84", "shades-of-purple", "night-owl"),
+    "light": ("one-light", "solarized-light", "base16-light", "yeti"),
+    "retro": ("monokai", "zenburn", "twilight", "cobalt"),
+    "minimal": ("nord", "oceanic-next", "panda-syntax"),
+}
+
 WindowTheme = Literal["none", "sharp", "bw", "boxy"]
 ExportSize = Literal["1x", "2x", "4x"]
+Fidelity = Literal["fast", "carbon"]
+
+# Local Carbon-style shell, rendered with page.set_content() instead of loading carbon.now.sh
+_SHELL_HTML = (Path(__file__).parent / "assets" / "carbon_shell.html").read_text(encoding="utf-8")
+
+# Carbon theme -> highlight.js stylesheet used by the local shell
+_OFFLINE_THEMES = {
+    "3024-night": "base16/3024",
+    "a11y-dark": "a11y-dark",
+    "base16-dark": "base16/default-dark",
+    "base16-light": "base16/default-light",
+    "dracula": "base16/dracula",
+    "hopscotch": "base16/hopscotch",
+    "material": "base16/material",
+    "monokai": "monokai",
+    "night-owl": "night-owl",
+    "nord": "nord",
+    "oceanic-next": "base16/oceanicnext",
+    "one-dark": "atom-one-dark",
+    "one-light": "atom-one-light",
+    "panda-syntax": "panda-syntax-dark",
+    "paraiso-dark": "base16/paraiso",
+    "seti": "base16/seti-ui",
+    "shades-of-purple": "shades-of-purple",
+    "solarized-dark": "base16/solarized-dark",
+    "solarized-light": "base16/solarized-light",
+    "twilight": "base16/twilight",
+    "vscode": "vs2015",
+    "zenburn": "base16/zenburn",
+}
+
+# Carbon theme -> Pygments style used by the browser-free fast path
+_PYGMENTS_THEME_MAP = {
+    "dracula": "dracula",
+    "material": "material",
+    "monokai": "monokai",
+    "nord": "nord",
+    "one-dark": "one-dark",
+    "paraiso-dark": "paraiso-dark",
+    "seti": "monokai",
+    "solarized-dark": "solarized-dark",
+    "solarized-light": "solarized-light",
+    "vscode": "github-dark",
+    "zenburn": "zenburn",
+}
+
+# Keeps filenames unique when several renders finish within the same second
+_render_seq = itertools.count(1)
+
+# Content-addressed render cache (see configure_render_cache)
+_CACHE_DIRNAME = ".carbon_cache"
+_cache_enabled = True
+_cache_max_entries = 200
+
+
+def configure_render_cache(enabled: bool = True, max_entries: int = 200) -> None:
+    """
+    Configure the PNG cache used by generate_code_image.
+
+    Args:
+        enabled: Reuse previously rendered images for identical requests.
+        max_entries: Maximum cached images per output directory (least recently used are evicted).
+    """
+    global _cache_enabled, _cache_max_entries
+    _cache_enabled = enabled
+    _cache_max_entries = max(1, max_entries)
+
+
+def _cache_path_for(output_dir: Path, renderer: str, carbon_url: str) -> Path:
+    # The Carbon URL encodes the code and every styling option
+    key = hashlib.blake2b(f"{renderer}|{carbon_url}".encode("utf-8"), digest_size=16).hexdigest()
+    return output_dir / _CACHE_DIRNAME / f"{key}.png"
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, copying when linking is not possible (e.g. cross-device)."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _store_in_cache(file_path: Path, cache_path: Path) -> None:
+    """Atomically add a rendered image to the cache and evict old entries."""
+    cache_dir = cache_path.parent
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = cache_dir / f"{cache_path.name}.{os.getpid()}.{file_path.stem}.tmp"
+    _link_or_copy(file_path, tmp_path)
+    os.replace(tmp_path, cache_path)
+
+    # Evict least recently used entries (hits refresh mtime)
+    entries = list(cache_dir.glob("*.png"))
+    if len(entries) > _cache_max_entries:
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for stale in entries[: len(entries) - _cache_max_entries]:
+            stale.unlink(missing_ok=True)
 
 
 def _repo_root() -> Path:
@@ -121,57 +265,315 @@ def _build_carbon_url(
     return f"https://carbon.now.sh/?{query_string}"
 
 
-async def _capture_carbon_screenshot(
-    url: str,
+def _parse_color(color: str) -> tuple[int, int, int, int]:
+    """Parse a CSS color (including rgba() with a 0-1 alpha) into an RGBA tuple."""
+    match = re.fullmatch(r"\s*rgba\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*([\d.]+)\s*\)\s*", color)
+    if match:
+        r, g, b, a = match.groups()
+        return int(r), int(g), int(b), round(float(a) * 255)
+
+    rgb = ImageColor.getrgb(color)
+    return rgb if len(rgb) == 4 else (*rgb, 255)
+
+
+def _render_with_pygments(
+    code: str,
+    language: str,
+    style: str,
+    background_color: str,
+    padding: int,
+    line_numbers: bool,
+    font_family: str,
+    font_size: int,
     output_path: Path,
-    wait_time: float = 3.0,
-    headless: bool = True,
 ) -> dict:
-    """Capture screenshot of Carbon page using local Playwright."""
+    """Render highlighted code with Pygments and compose it onto the background."""
+    try:
+        lexer = guess_lexer(code) if language == "auto" else get_lexer_by_name(language)
+    except ClassNotFound:
+        lexer = guess_lexer(code)
+
+    options = {
+        "style": style,
+        "font_size": font_size,
+        "line_numbers": line_numbers,
+        "image_format": "PNG",
+    }
+    try:
+        formatter = ImageFormatter(font_name=font_family, **options)
+    except Exception:
+        # Requested font is not installed; use Pygments' default monospace font
+        formatter = ImageFormatter(**options)
+
+    rendered = Image.open(io.BytesIO(highlight(code, lexer, formatter))).convert("RGBA")
+
+    canvas = Image.new(
+        "RGBA",
+        (rendered.width + 2 * padding, rendered.height + 2 * padding),
+        _parse_color(background_color),
+    )
+    canvas.paste(rendered, (padding, padding))
+    canvas.save(output_path, "PNG")
+
+    return {"success": True, "file_path": str(output_path)}
+
+
+async def _cdp_screenshot(page, selector: str, output_path: Path, scale: float = 2) -> bool:
+    """
+    Capture an element via CDP Page.captureScreenshot.
+
+    Skips Playwright's element-stability retry loop and its extra RPC hops.
+    Returns False if the element is not on the page.
+    """
+    clip = await page.evaluate(
+        """(selector) => {
+            const el = document.querySelector(selector);
+            if (!el) return null;
+            const r = el.getBoundingClientRect();
+            return {x: r.x + window.scrollX, y: r.y + window.scrollY, width: r.width, height: r.height};
+        }""",
+        selector,
+    )
+    if not clip:
+        return False
+
+    clip["scale"] = scale
+    cdp = await page.context.new_cdp_session(page)
     try:
-        from playwright.async_api import async_playwright
+        result = await cdp.send(
+            "Page.captureScreenshot",
+            {"format": "png", "clip": clip, "captureBeyondViewport": True},
+        )
+    finally:
+        await cdp.detach()
+
+    output_path.write_bytes(base64.b64decode(result["data"]))
+    return True
+
+
+async def _screenshot_export_container(page, output_path: Path) -> None:
+    """Screenshot the rendered code window, falling back to larger regions."""
+    # Screenshot just the code window straight through CDP
+    try:
+        captured = await _cdp_screenshot(page, ".export-container", output_path)
+    except Exception:
+        captured = False
+
+    if captured:
+        return
+
+    # Fallback: Playwright screenshots (non-Chromium or CDP unavailable)
+    export_container = await page.query_selector(".export-container")
+
+    if export_container:
+        await export_container.screenshot(path=str(output_path))
+    else:
+        # Screenshot the main container
+        container = await page.query_selector("#__next")
+        if container:
+            await container.screenshot(path=str(output_path))
+        else:
+            # Last resort: full page
+            await page.screenshot(path=str(output_path))
+
+
+async def _acquire_context(pool):
+    """Check out a browser context, returning (context, error_result)."""
+    try:
+        return await pool.acquire(), None
     except ImportError:
-        return {
+        return None, {
             "success": False,
             "error": "Missing playwright. Install with: pip install playwright && playwright install chromium"
         }
+    except Exception as e:
+        return None, {"success": False, "error": str(e)}
+
+
+async def _capture_carbon_screenshot(
+    url: str,
+    output_path: Path,
+    wait_time: float = 3.0,
+) -> dict:
+    """Capture screenshot of Carbon page using a pooled Playwright browser."""
+    pool = get_pool()
+    context, error = await _acquire_context(pool)
+    if error:
+        return error
 
     try:
-        async with async_playwright() as playwright:
-            browser = await playwright.chromium.launch(headless=headless)
-            page = await browser.new_page()
+        page = await context.new_page()
+        try:
+            # Navigate to Carbon with our configuration
+            await page.goto(url, wait_until="networkidle")
 
-            try:
-                # Navigate to Carbon with our configuration
-                await page.goto(url, wait_until="networkidle")
+            # Wait for the code to render
+            await asyncio.sleep(wait_time)
+
+            await _screenshot_export_container(page, output_path)
+        finally:
+            # Pooled contexts may be shared, so never leave pages behind
+            await page.close()
 
-                # Wait for the code to render
-                await asyncio.sleep(wait_time)
+        return {"success": True, "file_path": str(output_path)}
 
-                # Find the export container (the code window)
-                export_container = await page.query_selector(".export-container")
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+    finally:
+        await pool.release(context)
+
+
+async def _capture_shell_screenshot(
+    code: str,
+    language: str,
+    output_path: Path,
+    options: dict,
+) -> dict:
+    """Render code in the local Carbon-style shell and capture it."""
+    pool = get_pool()
+    context, error = await _acquire_context(pool)
+    if error:
+        return error
 
-                if export_container:
-                    # Screenshot just the code window
-                    await export_container.screenshot(path=str(output_path))
-                else:
-                    # Fallback: screenshot the main container
-                    container = await page.query_selector("#__next")
-                    if container:
-                        await container.screenshot(path=str(output_path))
-                    else:
-                        # Last resort: full page
-                        await page.screenshot(path=str(output_path))
+    try:
+        page = await context.new_page()
+        try:
+            await page.set_content(_SHELL_HTML, wait_until="domcontentloaded")
+            await page.evaluate(
+                "([code, language, options]) => window.renderCode(code, language, options)",
+                [code, language, options],
+            )
 
-                return {"success": True, "file_path": str(output_path)}
+            await _screenshot_export_container(page, output_path)
+        finally:
+            # Pooled contexts may be shared, so never leave pages behind
+            await page.close()
 
-            finally:
-                await page.close()
-                await browser.close()
+        return {"success": True, "file_path": str(output_path)}
 
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+    finally:
+        await pool.release(context)
+
+
+async def _render_code_image(
+    code: str,
+    language: str = "auto",
+    theme: str = "seti",
+    background_color: str = "rgba(171,184,195,1)",
+    window_theme: str = "none",
+    padding: int = 56,
+    line_numbers: bool = False,
+    font_family: str = "Fira Code",
+    font_size: int = 14,
+    output_dir: str = "output",
+    online: bool = False,
+    fidelity: str = "carbon",
+) -> dict:
+    """Render one code image; runs on the shared runtime loop (see generate_code_image)."""
+    # Build Carbon URL
+    carbon_url = _build_carbon_url(
+        code=code,
+        language=language,
+        theme=theme,
+        background_color=background_color,
+        window_theme=window_theme,
+        padding_vertical=padding,
+        padding_horizontal=padding,
+        line_numbers=line_numbers,
+        font_family=font_family,
+        font_size=font_size,
+    )
+
+    # Ensure output directory exists
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Generate filename
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"carbon_code_{timestamp}_{next(_render_seq)}.png"
+    file_path = output_path / filename
+
+    if fidelity == "fast" and not online and theme in _PYGMENTS_THEME_MAP and HAS_PYGMENTS and HAS_PIL:
+        renderer = "pygments"
+    elif online or theme not in _OFFLINE_THEMES:
+        renderer = "carbon"
+    else:
+        renderer = "shell"
+
+    # Identical requests reuse the cached render instead of launching a browser
+    cache_path = _cache_path_for(output_path, renderer, carbon_url) if _cache_enabled else None
+    if cache_path is not None and cache_path.exists():
+        try:
+            _link_or_copy(cache_path, file_path)
+            os.utime(cache_path)
+            return {
+                "success": True,
+                "file_path": str(file_path),
+                "url": carbon_url,
+                "renderer": renderer,
+                "cached": True,
+                "message": f"Code image saved to {file_path}",
+            }
+        except OSError:
+            pass
+
+    if renderer == "pygments":
+        capture = asyncio.to_thread(
+            _render_with_pygments,
+            code=code,
+            language=language,
+            style=_PYGMENTS_THEME_MAP[theme],
+            background_color=background_color,
+            padding=padding,
+            line_numbers=line_numbers,
+            font_family=font_family,
+            font_size=font_size,
+            output_path=file_path,
+        )
+    elif renderer == "shell":
+        capture = _capture_shell_screenshot(
+            code=code,
+            language=language,
+            output_path=file_path,
+            options={
+                "theme": _OFFLINE_THEMES[theme],
+                "background": background_color,
+                "windowTheme": window_theme,
+                "padding": padding,
+                "lineNumbers": line_numbers,
+                "fontFamily": font_family,
+                "fontSize": font_size,
+            },
+        )
+    else:
+        capture = _capture_carbon_screenshot(
+            url=carbon_url,
+            output_path=file_path,
+        )
+
+    try:
+        result = await capture
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+
+    # Add URL to result for debugging
+    result["url"] = carbon_url
+    result["renderer"] = renderer
+
+    if result["success"]:
+        result["message"] = f"Code image saved to {file_path}"
+        if cache_path is not None:
+            try:
+                _store_in_cache(file_path, cache_path)
+            except OSError:
+                pass
+
+    return result
+
 
 @tool
 def generate_code_image(
@@ -185,12 +587,17 @@ def generate_code_image(
     font_family: str = "Fira Code",
     font_size: int = 14,
     output_dir: str = "output",
+    online: bool = False,
+    fidelity: Fidelity = "carbon",
 ) -> dict:
     """
     Generate a beautiful code screenshot using Carbon.
 
     Uses Playwright to render code with Carbon (carbon.now.sh)
-    and capture a high-quality screenshot.
+    and capture a high-quality screenshot. Browsers are kept warm in a
+    shared pool, so only the first call pays the Chromium startup cost.
+    Most themes are rendered from a local Carbon-style page, which skips
+    loading the hosted Carbon app on every call.
 
     Args:
         code: The source code to render.
@@ -214,12 +621,19 @@ def generate_code_image(
         font_family: Font for code (default: "Fira Code").
         font_size: Font size in pixels (default: 14).
         output_dir: Directory to save the image (default: "output").
+        online: Always render with the hosted carbon.now.sh app (default: False).
+            Themes without a local equivalent use it regardless.
+        fidelity: "carbon" (default) for the full Carbon look, or "fast" to draw
+            the image with Pygments without a browser (no window chrome) when
+            the theme has a Pygments equivalent.
 
     Returns:
         dict with keys:
             - success: bool indicating if generation succeeded
             - file_path: path to saved image (if successful)
             - url: Carbon URL used (for debugging)
+            - renderer: "pygments", "shell" (local page) or "carbon" (carbon.now.sh)
+            - cached: True if the image was reused from the render cache
             - error: error message (if failed)
 
     Examples:
@@ -246,50 +660,45 @@ def generate_code_image(
             window_theme="none"
         )
     """
-    # Build Carbon URL
-    carbon_url = _build_carbon_url(
-        code=code,
-        language=language,
-        theme=theme,
-        background_color=background_color,
-        window_theme=window_theme,
-        padding_vertical=padding,
-        padding_horizontal=padding,
-        line_numbers=line_numbers,
-        font_family=font_family,
-        font_size=font_size,
+    return run_async(
+        _render_code_image(
+            code=code,
+            language=language,
+            theme=theme,
+            background_color=background_color,
+            window_theme=window_theme,
+            padding=padding,
+            line_numbers=line_numbers,
+            font_family=font_family,
+            font_size=font_size,
+            output_dir=output_dir,
+            online=online,
+            fidelity=fidelity,
+        )
     )
 
-    # Ensure output directory exists
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
 
-    # Generate filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"carbon_code_{timestamp}.png"
-    file_path = output_path / filename
+def generate_code_images(jobs: list[dict], concurrency: int = 4) -> list[dict]:
+    """
+    Render several code images concurrently on the shared browser pool.
 
-    # Run async capture
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    Args:
+        jobs: Keyword arguments for generate_code_image(), one dict per image.
+        concurrency: Maximum renders in flight at once (default: 4).
 
-    result = loop.run_until_complete(
-        _capture_carbon_screenshot(
-            url=carbon_url,
-            output_path=file_path,
-        )
-    )
+    Returns:
+        List of generate_code_image() results, in the same order as jobs.
+    """
+    async def render_all() -> list[dict]:
+        sem = asyncio.Semaphore(max(1, concurrency))
 
-    # Add URL to result for debugging
-    result["url"] = carbon_url
+        async def one(job: dict) -> dict:
+            async with sem:
+                return await _render_code_image(**job)
 
-    if result["success"]:
-        result["message"] = f"Code image saved to {file_path}"
+        return await asyncio.gather(*(one(job) for job in jobs))
 
-    return result
+    return run_async(render_all())
 
 
 @tool
@@ -302,26 +711,9 @@ def list_carbon_themes() -> dict:
             - themes: list of available theme names
             - recommended: dict of recommended themes by category
     """
-    themes = [
-        "3024-night", "a11y-dark", "blackboard", "base16-dark", "base16-light",
-        "cobalt", "dracula", "duotone-dark", "hopscotch", "lucario", "material",
-        "monokai", "night-owl", "nord", "oceanic-next", "one-light", "one-dark",
-        "panda-syntax", "paraiso-dark", "seti", "shades-of-purple", "solarized-dark",
-        "solarized-light", "synthwave-84", "twilight", "verminal", "vscode",
-        "yeti", "zenburn"
-    ]
-
-    recommended = {
-        "dark_professional": ["seti", "vscode", "one-dark", "material"],
-        "dark_vibrant": ["dracula", "synthwave-84", "shades-of-purple", "night-owl"],
-        "light": ["one-light", "solarized-light", "base16-light", "yeti"],
-        "retro": ["monokai", "zenburn", "twilight", "cobalt"],
-        "minimal": ["nord", "oceanic-next", "panda-syntax"],
-    }
-
     return {
-        "themes": themes,
-        "recommended": recommended,
+        "themes": list(_THEMES),
+        "recommended": {category: list(names) for category, names in _RECOMMENDED_THEMES.items()},
         "default": "seti",
     }
 
@@ -340,6 +732,8 @@ def generate_code_image_from_file(
     font_family: str = "Fira Code",
     font_size: int = 14,
     output_dir: str = "output",
+    online: bool = False,
+    fidelity: Fidelity = "carbon",
     max_lines: int = 250,
     max_bytes: int = 250_000,
 ) -> dict:
@@ -356,7 +750,7 @@ def generate_code_image_from_file(
         start_line: 1-based start line (inclusive). Defaults to start of file.
         end_line: 1-based end line (inclusive). Defaults to end of file.
         language: Language for Carbon highlighting ("auto" to infer from extension).
-        theme/background_color/window_theme/padding/line_numbers/font_family/font_size/output_dir:
+        theme/background_color/window_theme/padding/line_numbers/font_family/font_size/output_dir/online/fidelity:
             Same as generate_code_image().
         max_lines: Max lines of code to include in the image (default: 250).
         max_bytes: Max bytes to read from disk (default: 250KB).
@@ -463,6 +857,8 @@ def generate_code_image_from_file(
         font_family=font_family,
         font_size=font_size,
         output_dir=output_dir,
+        online=online,
+        fidelity=fidelity,
     )
 
     # Add source metadata
@@ -7,6 +7,7 @@ Requires ffmpeg to be installed on the system.
 
 from __future__ import annotations
 
+import json
 import subprocess
 import shutil
 import tempfile
@@ -225,7 +226,6 @@ def get_video_info(input_path: str) -> str:
         if result.returncode != 0:
             return f"Error: {result.stderr}"
 
-        import json
         data = json.loads(result.stdout)
 
         # Extract key info
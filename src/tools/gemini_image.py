@@ -17,9 +17,14 @@ from datetime import datetime
 from typing import Literal, Optional, List
 
 from strands import tool
-from google import genai
 from google.genai import types
 
+if __package__:
+    from ._genai_client import get_client
+else:
+    # Loaded as a standalone file by Agent(load_tools_from_directory=True)
+    from tools._genai_client import get_client
+
 
 ImageModel = Literal["gemini-2.5-flash-image", "gemini-3-pro-image-preview"]
 AspectRatio = Literal["1:1", "2:3", "3:2", "3:4", "4:3", "4:5", "5:4", "9:16", "16:9", "21:9"]
@@ -114,7 +119,7 @@ def generate_image(
         return {"success": False, "error": "Maximum 14 reference images supported"}
 
     try:
-        client = genai.Client(api_key=api_key)
+        client = get_client(api_key)
 
         # Build contents
         contents = []
@@ -258,7 +263,7 @@ def edit_image(
             return {"success": False, "error": "image_size is only supported with gemini-3-pro-image-preview"}
 
     try:
-        client = genai.Client(api_key=api_key)
+        client = get_client(api_key)
 
         # Build contents - images first, then prompt
         contents = []
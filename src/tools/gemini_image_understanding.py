@@ -17,9 +17,14 @@ from datetime import datetime
 from typing import Literal, Optional, List
 
 from strands import tool
-from google import genai
 from google.genai import types
 
+if __package__:
+    from ._genai_client import get_client
+else:
+    # Loaded as a standalone file by Agent(load_tools_from_directory=True)
+    from tools._genai_client import get_client
+
 try:
     from PIL import Image
     HAS_PIL = True
@@ -155,7 +160,7 @@ def understand_image(
         return {"success": False, "error": "Provide only one of: image_path, image_url, or image_paths"}
 
     try:
-        client = genai.Client(api_key=api_key)
+        client = get_client(api_key)
 
         # Build contents
         contents = []
@@ -257,7 +262,7 @@ def detect_objects(
         return {"success": False, "error": f"Image file not found: {image_path}"}
 
     try:
-        client = genai.Client(api_key=api_key)
+        client = get_client(api_key)
 
         # Load image to get dimensions
         image = Image.open(path)
@@ -395,7 +400,7 @@ def segment_objects(
         return {"success": False, "error": f"Image file not found: {image_path}"}
 
     try:
-        client = genai.Client(api_key=api_key)
+        client = get_client(api_key)
 
         # Load and optionally resize image
         image = Image.open(path)
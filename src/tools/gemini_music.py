@@ -9,6 +9,7 @@ Note: Requires the v1alpha API version.
 
 import os
 import asyncio
+import itertools
 import wave
 from pathlib import Path
 from datetime import datetime
@@ -16,6 +17,9 @@ from strands import tool
 from google import genai
 from google.genai import types
 
+# Keeps filenames unique when several generations finish within the same second
+_file_seq = itertools.count(1)
+
 
 def _save_audio_to_wav(audio_data: bytes, file_path: str) -> None:
     """Save raw PCM audio data to WAV file (48kHz stereo 16-bit)."""
@@ -138,7 +142,7 @@ def generate_music(
         output_path.mkdir(parents=True, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"gemini_music_{timestamp}.wav"
+        filename = f"gemini_music_{timestamp}_{next(_file_seq)}.wav"
         file_path = output_path / filename
 
         _save_audio_to_wav(audio_data, str(file_path))
@@ -225,7 +229,7 @@ def generate_music_weighted(
         output_path.mkdir(parents=True, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"gemini_music_weighted_{timestamp}.wav"
+        filename = f"gemini_music_weighted_{timestamp}_{next(_file_seq)}.wav"
         file_path = output_path / filename
 
         _save_audio_to_wav(audio_data, str(file_path))
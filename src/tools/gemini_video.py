@@ -13,15 +13,28 @@ Features:
 """
 
 import os
+import itertools
+import threading
 import time
 from pathlib import Path
 from datetime import datetime
 from typing import Literal, Optional, List
 
 from strands import tool
-from google import genai
 from google.genai import types
 
+if __package__:
+    from ._genai_client import get_client
+else:
+    # Loaded as a standalone file by Agent(load_tools_from_directory=True)
+    from tools._genai_client import get_client
+
+# Keeps filenames unique when several videos finish within the same second
+_file_seq = itertools.count(1)
+
+# Shared HTTP session for URI downloads (created on first use)
+_download_session = None
+_download_session_lock = threading.Lock()
 
 VideoModel = Literal[
     "veo-3.1-generate-preview",
@@ -60,13 +73,24 @@ def _load_image(image_path: str) -> types.Image:
     return types.Image(image_bytes=image_bytes, mime_type=mime_type)
 
 
+def _get_download_session():
+    """Get the shared requests.Session so repeated downloads reuse the TLS connection."""
+    global _download_session
+    with _download_session_lock:
+        if _download_session is None:
+            import requests
+
+            _download_session = requests.Session()
+        return _download_session
+
+
 def _save_video(client, generated_video, output_dir: str, prefix: str, api_key: str) -> dict:
     """Save generated video to file."""
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{prefix}_{timestamp}.mp4"
+    filename = f"{prefix}_{timestamp}_{next(_file_seq)}.mp4"
     file_path = output_path / filename
 
     # Try to download using client.files.download first
@@ -89,16 +113,25 @@ def _save_video(client, generated_video, output_dir: str, prefix: str, api_key:
 
         # Fallback: try URI download
         if hasattr(video_obj, 'uri') and video_obj.uri:
-            import requests
             # Handle both query param formats
             separator = "&" if "?" in video_obj.uri else "?"
             url = f"{video_obj.uri}{separator}key={api_key}"
-            response = requests.get(url, allow_redirects=True)
-            if response.status_code == 200:
-                with open(file_path, "wb") as f:
-                    f.write(response.content)
-                return {"success": True, "file_path": str(file_path)}
-            return {"success": False, "error": f"Failed to download video: HTTP {response.status_code}"}
+            # Stream to a partial file so the MP4 never sits fully in memory
+            # and a failed download does not leave a truncated video behind
+            with _get_download_session().get(url, allow_redirects=True, stream=True, timeout=60) as response:
+                if response.status_code != 200:
+                    return {"success": False, "error": f"Failed to download video: HTTP {response.status_code}"}
+
+                part_path = file_path.with_name(file_path.name + ".part")
+                try:
+                    with open(part_path, "wb") as f:
+                        for chunk in response.iter_content(chunk_size=1024 * 1024):
+                            f.write(chunk)
+                    os.replace(part_path, file_path)
+                except Exception:
+                    part_path.unlink(missing_ok=True)
+                    raise
+            return {"success": True, "file_path": str(file_path)}
 
     return {"success": False, "error": "No video data in response"}
 
@@ -218,7 +251,7 @@ def generate_video(
             return {"success": False, "error": "Maximum 3 reference images supported"}
 
     try:
-        client = genai.Client(api_key=api_key)
+        client = get_client(api_key)
 
         # Build config
         config_kwargs = {}
@@ -366,7 +399,7 @@ def generate_video_from_image(
         return {"success": False, "error": str(e)}
 
     try:
-        client = genai.Client(api_key=api_key)
+        client = get_client(api_key)
 
         # Build config
         config_kwargs = {}
@@ -478,7 +511,7 @@ def extend_video(
         return {"success": False, "error": f"Video file not found: {video_path}"}
 
     try:
-        client = genai.Client(api_key=api_key)
+        client = get_client(api_key)
 
         # Read video file
         with open(video_file, "rb") as f:
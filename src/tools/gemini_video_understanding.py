@@ -20,6 +20,12 @@ from strands import tool
 from google import genai
 from google.genai import types
 
+if __package__:
+    from ._genai_client import get_client
+else:
+    # Loaded as a standalone file by Agent(load_tools_from_directory=True)
+    from tools._genai_client import get_client
+
 
 _DEFAULT_INLINE_MAX_BYTES = 20 * 1024 * 1024  # 20MB (docs guidance)
 
@@ -90,9 +96,7 @@ def _build_video_part(
 
 def _create_client(*, api_key: str, api_version: str) -> genai.Client:
     # media_resolution is currently documented as v1alpha-only; other requests can use default.
-    if api_version:
-        return genai.Client(api_key=api_key, http_options={"api_version": api_version})
-    return genai.Client(api_key=api_key)
+    return get_client(api_key, api_version or None)
 
 
 def _wait_for_uploaded_file_ready(
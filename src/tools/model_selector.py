@@ -4,6 +4,7 @@ Model selector tool for Strands agents.
 Provides model information to help agents choose the best model for a task.
 """
 
+import json
 from typing import Literal, Optional
 from strands import tool
 
@@ -385,8 +386,6 @@ def get_available_models(
         Find Google models for long context:
         get_available_models(provider="google", capability="long-context")
     """
-    import json
-
     quality_levels = {"good": 1, "high": 2, "highest": 3}
 
     filtered = {}
@@ -432,8 +431,6 @@ def get_model_recommendation(
         get_model_recommendation("write complex code with detailed explanations", priority="quality")
         get_model_recommendation("simple classification task", priority="cost")
     """
-    import json
-
     task_lower = task_description.lower()
 
     # Analyze task requirements
@@ -565,8 +562,6 @@ def compare_models(model_ids: list[str]) -> str:
     Example:
         compare_models(["claude-sonnet-4-20250514", "gpt-4o", "o1-mini"])
     """
-    import json
-
     comparison = {}
     for model_id in model_ids:
         if model_id in MODELS:
@@ -0,0 +1,74 @@
+"""Tests for the CachedModel response cache in src/models/models.py."""
+
+import asyncio
+import os
+import sys
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from models.models import CachedModel
+
+
+class FakeModel:
+    """Provider stand-in that counts stream() calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        self.calls += 1
+        yield {"messageStart": {"role": "assistant"}}
+        yield {"contentBlockDelta": {"delta": {"text": "hello"}}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+
+
+MESSAGES = [{"role": "user", "content": [{"text": "hi"}]}]
+
+
+def _collect(model, messages=MESSAGES, **kwargs):
+    async def run():
+        return [event async for event in model.stream(messages, None, "You are helpful.", **kwargs)]
+
+    return asyncio.run(run())
+
+
+def _agent_kwargs():
+    """The per-invocation kwargs the Strands event loop passes on every cycle."""
+    return {
+        "invocation_state": {"event_loop_cycle_id": uuid.uuid4()},
+        "model_state": {},
+        "cancel_signal": object(),
+    }
+
+
+def test_repeat_request_hits_despite_per_call_agent_state():
+    fake = FakeModel()
+    model = CachedModel(fake)
+
+    first = _collect(model, **_agent_kwargs())
+    second = _collect(model, **_agent_kwargs())
+
+    assert fake.calls == 1
+    assert first == second
+    assert len(model._entries) == 1
+
+
+def test_request_shaping_kwargs_are_part_of_the_key():
+    fake = FakeModel()
+    model = CachedModel(fake)
+
+    _collect(model, tool_choice={"auto": {}})
+    _collect(model, tool_choice={"any": {}})
+
+    assert fake.calls == 2
+
+
+def test_different_messages_miss():
+    fake = FakeModel()
+    model = CachedModel(fake)
+
+    _collect(model)
+    _collect(model, messages=[{"role": "user", "content": [{"text": "bye"}]}])
+
+    assert fake.calls == 2